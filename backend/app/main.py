@@ -1,6 +1,8 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+import hashlib
 import logging
 
 from .config import settings
@@ -75,6 +77,39 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Conditional GET: hash successful GET bodies into a weak ETag and
+# answer If-None-Match hits with an empty 304. The frontend polls the
+# stats/list endpoints; unchanged responses now cost headers only.
+@app.middleware("http")
+async def etag_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method != "GET" or response.status_code != 200:
+        return response
+
+    body = b""
+    async for chunk in response.body_iterator:
+        body += chunk
+
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type
+    )
+
+
+# Gzip responses for clients that advertise it. Added after the ETag
+# middleware so it wraps it: ETags are computed (and If-None-Match
+# compared) on the uncompressed body, then the 200s are compressed on
+# the way out. Tiny payloads aren't worth the CPU, hence minimum_size.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
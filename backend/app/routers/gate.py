@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime, timezone
+import base64
 import logging
 
 from ..database import get_db
@@ -19,20 +20,21 @@ router = APIRouter(prefix="/gate", tags=["Gate Verification"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/verify", response_model=GateVerificationResponse)
-def verify_entry(
-    request: GateVerificationRequest,
-    verified_by: int = Query(..., description="Security personnel ID"),
-    db: Session = Depends(get_db)
-):
+def _process_face_verification(
+    db: Session,
+    face_image_base64: str,
+    gate_id: str,
+    verified_by: int
+) -> GateVerificationResponse:
     """
-    Verify a person at the gate using face recognition.
+    Shared face-verification flow used by both the JSON and the
+    multipart endpoints.
     """
     captured_image_url = None
     watchlist_alert_data = None
-    
+
     # Step 1: Check against watchlist FIRST
-    watchlist_result = face_service.search_watchlist(request.face_image_base64)
+    watchlist_result = face_service.search_watchlist(face_image_base64)
     
     if watchlist_result.get('watchlist_match') and watchlist_result.get('best_match'):
         match = watchlist_result['best_match']
@@ -54,14 +56,14 @@ def verify_entry(
                 db=db,
                 watchlist_person_id=person.id,
                 confidence_score=confidence * 100,  # Convert to percentage
-                gate_id=request.gate_id,
+                gate_id=gate_id,
                 captured_image_url=captured_image_url
             )
             
             # Log the entry attempt
             entry_log = EntryLog(
                 entry_type=EntryType.ENTRY,
-                gate_id=request.gate_id,
+                gate_id=gate_id,
                 person_name=person.full_name,
                 status=EntryStatus.WATCHLIST_ALERT,
                 verification_method=VerificationMethod.FACE_RECOGNITION,
@@ -103,7 +105,7 @@ def verify_entry(
     
     # Step 2: Search for visitor/resident matches
     search_result = face_service.search_face(
-        image_base64=request.face_image_base64,
+        image_base64=face_image_base64,
         person_types=['visitor', 'resident'],
         top_k=5
     )
@@ -112,7 +114,7 @@ def verify_entry(
     if not search_result.get("success"):
         entry_log = EntryLog(
             entry_type=EntryType.ENTRY,
-            gate_id=request.gate_id,
+            gate_id=gate_id,
             status=EntryStatus.MANUAL_VERIFICATION,
             verification_method=VerificationMethod.MANUAL,
             captured_image_url=captured_image_url,
@@ -153,7 +155,7 @@ def verify_entry(
                     # Allow entry
                     entry_log = EntryLog(
                         entry_type=EntryType.ENTRY,
-                        gate_id=request.gate_id,
+                        gate_id=gate_id,
                         visitor_id=visitor.id,
                         person_name=visitor.full_name,
                         status=EntryStatus.ALLOWED,
@@ -182,7 +184,7 @@ def verify_entry(
                     # Deny entry
                     entry_log = EntryLog(
                         entry_type=EntryType.ENTRY,
-                        gate_id=request.gate_id,
+                        gate_id=gate_id,
                         visitor_id=visitor.id,
                         person_name=visitor.full_name,
                         status=EntryStatus.DENIED,
@@ -211,7 +213,7 @@ def verify_entry(
                 
                 entry_log = EntryLog(
                     entry_type=EntryType.ENTRY,
-                    gate_id=request.gate_id,
+                    gate_id=gate_id,
                     person_name=person_name,
                     status=EntryStatus.MANUAL_VERIFICATION,
                     verification_method=VerificationMethod.FACE_RECOGNITION,
@@ -237,7 +239,7 @@ def verify_entry(
             # Resident entry - always allowed
             entry_log = EntryLog(
                 entry_type=EntryType.ENTRY,
-                gate_id=request.gate_id,
+                gate_id=gate_id,
                 person_name=person_name,
                 status=EntryStatus.ALLOWED,
                 verification_method=VerificationMethod.FACE_RECOGNITION,
@@ -263,7 +265,7 @@ def verify_entry(
     
     entry_log = EntryLog(
         entry_type=EntryType.ENTRY,
-        gate_id=request.gate_id,
+        gate_id=gate_id,
         status=EntryStatus.MANUAL_VERIFICATION,
         verification_method=VerificationMethod.MANUAL,
         captured_image_url=captured_image_url,
@@ -283,6 +285,39 @@ def verify_entry(
     )
 
 
+@router.post("/verify", response_model=GateVerificationResponse)
+def verify_entry(
+    request: GateVerificationRequest,
+    verified_by: int = Query(..., description="Security personnel ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    Verify a person at the gate using face recognition.
+    """
+    return _process_face_verification(
+        db, request.face_image_base64, request.gate_id, verified_by
+    )
+
+
+@router.post("/verify-image", response_model=GateVerificationResponse)
+def verify_entry_image(
+    image: UploadFile = File(..., description="Captured face image"),
+    gate_id: str = Form("MAIN_GATE"),
+    verified_by: int = Query(..., description="Security personnel ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    Multipart variant of /verify - accepts the raw image bytes instead
+    of a base64 JSON payload (~25% smaller on the wire).
+    """
+    image_bytes = image.file.read()
+    if not image_bytes:
+        raise HTTPException(status_code=400, detail="Empty image upload")
+
+    face_image_base64 = base64.b64encode(image_bytes).decode()
+    return _process_face_verification(db, face_image_base64, gate_id, verified_by)
+
+
 @router.post("/verify-code")
 def verify_by_code(
     approval_code: str = Query(..., description="Visitor approval code"),
@@ -397,6 +432,40 @@ def manual_deny_entry(
     return {"message": "Entry manually denied", "entry_log_id": entry_log.id}
 
 
+@router.get("/dashboard")
+def get_gate_dashboard(db: Session = Depends(get_db)):
+    """Get today's logs, stats and active visitors in one payload.
+
+    Lets the gate page hydrate with a single request instead of
+    separate calls for logs, stats and active visitors.
+    """
+    today_start = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+    logs = db.query(EntryLog).filter(
+        EntryLog.timestamp >= today_start
+    ).order_by(EntryLog.timestamp.desc()).all()
+
+    total = len(logs)
+    allowed = sum(1 for l in logs if l.status == EntryStatus.ALLOWED)
+    denied = sum(1 for l in logs if l.status == EntryStatus.DENIED)
+    alerts = sum(1 for l in logs if l.status == EntryStatus.WATCHLIST_ALERT)
+
+    active_visitors = visitor_service.get_active_visitors(db)
+
+    return {
+        "logs": logs,
+        "stats": {
+            "total": total,
+            "allowed": allowed,
+            "denied": denied,
+            "watchlist_alerts": alerts
+        },
+        "active_visitors": active_visitors
+    }
+
+
 @router.get("/logs", response_model=EntryLogListResponse)
 def get_entry_logs(
     skip: int = Query(0, ge=0),
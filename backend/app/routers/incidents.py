@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
+import base64
 
 from ..database import get_db
 from ..schemas.schemas import (
-    IncidentCreate, IncidentUpdate, IncidentResponse,
-    IncidentListResponse, IncidentDetailResponse,
+    IncidentCreate, IncidentUpdate, IncidentUpdateWithComment, IncidentResponse,
+    IncidentListResponse, IncidentDetailResponse, IncidentBatchRequest,
     IncidentStatus, IncidentSeverity, IncidentCategory
 )
 from ..services.incident_service import incident_service
@@ -55,6 +56,18 @@ def list_incidents(
     )
 
 
+@router.post("/batch", response_model=List[IncidentResponse])
+def get_incidents_batch(
+    request: IncidentBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """Fetch several incidents by ID in one request"""
+    if not request.ids:
+        raise HTTPException(status_code=400, detail="No ids provided")
+
+    return incident_service.get_incidents_by_ids(db, request.ids)
+
+
 @router.get("/open")
 def get_open_incidents(db: Session = Depends(get_db)):
     """Get all open incidents (Open, In Progress, Escalated)"""
@@ -163,6 +176,23 @@ def update_incident(
     return incident
 
 
+@router.post("/{incident_id}/update-with-comment", response_model=IncidentResponse)
+def update_incident_with_comment(
+    incident_id: int,
+    payload: IncidentUpdateWithComment,
+    updated_by: int = Query(..., description="ID of user updating the incident"),
+    db: Session = Depends(get_db)
+):
+    """Update incident fields and add a comment in one atomic request"""
+    update_data = IncidentUpdate(**payload.model_dump(exclude_unset=True, exclude={"comment"}))
+    incident = incident_service.update_with_comment(
+        db, incident_id, update_data, payload.comment, updated_by
+    )
+    if not incident:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    return incident
+
+
 @router.post("/{incident_id}/assign")
 def assign_incident(
     incident_id: int,
@@ -217,3 +247,24 @@ def add_evidence(
     if not url:
         raise HTTPException(status_code=400, detail=details.get("error", "Failed to add evidence"))
     return {"message": "Evidence added", "url": url}
+
+
+@router.post("/{incident_id}/evidence/upload")
+async def add_evidence_upload(
+    incident_id: int,
+    added_by: int = Query(..., description="User ID adding the evidence"),
+    file: UploadFile = File(..., description="Evidence image"),
+    db: Session = Depends(get_db)
+):
+    """Add evidence as a raw multipart upload.
+
+    Raw bytes on the wire instead of base64-in-JSON: roughly 25% less
+    transfer and no encode pass on the client.
+    """
+    image_bytes = await file.read()
+    image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+
+    url, details = incident_service.add_evidence(db, incident_id, image_base64, added_by)
+    if not url:
+        raise HTTPException(status_code=400, detail=details.get("error", "Failed to add evidence"))
+    return {"message": "Evidence added", "url": url}
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 
 from ..database import get_db
 from ..schemas.schemas import (
     VisitorCreate, VisitorUpdate, VisitorResponse,
-    VisitorListResponse, VisitorStatus
+    VisitorListResponse, VisitorStatus, VisitorBulkActionRequest,
+    VisitorBatchRequest
 )
 from ..services.visitor_service import visitor_service
 
@@ -53,10 +54,39 @@ def list_visitors(
     )
 
 
+@router.post("/bulk-action")
+def bulk_visitor_action(
+    request: VisitorBulkActionRequest,
+    db: Session = Depends(get_db)
+):
+    """Apply check-in/check-out/cancel to several visitors in one request"""
+    if not request.actions:
+        raise HTTPException(status_code=400, detail="No actions provided")
+
+    return visitor_service.bulk_action(
+        db, [item.model_dump() for item in request.actions]
+    )
+
+
+@router.post("/batch", response_model=List[VisitorResponse])
+def get_visitors_batch(
+    request: VisitorBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """Fetch several visitors by ID in one request"""
+    if not request.ids:
+        raise HTTPException(status_code=400, detail="No ids provided")
+
+    return visitor_service.get_visitors_by_ids(db, request.ids)
+
+
 @router.get("/active")
-def get_active_visitors(db: Session = Depends(get_db)):
-    """Get all currently checked-in visitors"""
-    visitors = visitor_service.get_active_visitors(db)
+def get_active_visitors(
+    visiting_unit: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get all currently checked-in visitors, optionally for one unit"""
+    visitors = visitor_service.get_active_visitors(db, visiting_unit)
     return {"visitors": visitors, "count": len(visitors)}
 
 
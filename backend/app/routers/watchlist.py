@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 from typing import Optional
+import base64
 
 from ..database import get_db
 from ..schemas.schemas import (
     WatchlistPersonCreate, WatchlistPersonUpdate, WatchlistPersonResponse,
     WatchlistAlertResponse, WatchlistAlertAcknowledge, WatchlistAlertResolve,
+    WatchlistAlertBulkAcknowledge,
     AlertSeverity, WatchlistCategory
 )
 from ..services.watchlist_service import watchlist_service
@@ -30,6 +32,48 @@ def add_to_watchlist(
     return person
 
 
+@router.post("/persons/upload", response_model=WatchlistPersonResponse)
+def add_to_watchlist_multipart(
+    added_by: int = Query(..., description="ID of user adding to watchlist"),
+    face_image: Optional[UploadFile] = File(None),
+    full_name: str = Form(...),
+    alias: Optional[str] = Form(None),
+    phone: Optional[str] = Form(None),
+    category: WatchlistCategory = Form(...),
+    severity: AlertSeverity = Form(AlertSeverity.MEDIUM),
+    reason: str = Form(...),
+    last_known_address: Optional[str] = Form(None),
+    physical_description: Optional[str] = Form(None),
+    db: Session = Depends(get_db)
+):
+    """Add a person to the watchlist with the photo sent as a raw
+    multipart file instead of base64 JSON (~25% smaller payload)"""
+    face_image_base64 = None
+    if face_image:
+        image_bytes = face_image.file.read()
+        if image_bytes:
+            face_image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+
+    person_data = WatchlistPersonCreate(
+        full_name=full_name,
+        alias=alias,
+        phone=phone,
+        category=category,
+        severity=severity,
+        reason=reason,
+        last_known_address=last_known_address,
+        physical_description=physical_description,
+        face_image_base64=face_image_base64
+    )
+
+    person, details = watchlist_service.add_person(db, person_data, added_by)
+
+    if not person:
+        raise HTTPException(status_code=400, detail=details.get("error", "Failed to add to watchlist"))
+
+    return person
+
+
 @router.get("/persons")
 def get_watchlist(
     skip: int = Query(0, ge=0),
@@ -56,6 +100,12 @@ def get_watchlist(
     }
 
 
+@router.get("/count")
+def get_watchlist_count(db: Session = Depends(get_db)):
+    """Count of active watchlist entries - cheap stats for dashboards"""
+    return {"total": watchlist_service.get_active_count(db)}
+
+
 @router.get("/persons/active")
 def get_active_watchlist(db: Session = Depends(get_db)):
     """Get all active watchlist entries"""
@@ -197,6 +247,20 @@ def get_alert(alert_id: int, db: Session = Depends(get_db)):
     }
 
 
+@router.post("/alerts/acknowledge-bulk")
+def acknowledge_alerts_bulk(
+    request: WatchlistAlertBulkAcknowledge,
+    acknowledged_by: int = Query(..., description="User ID acknowledging the alerts"),
+    db: Session = Depends(get_db)
+):
+    """Acknowledge multiple alerts in a single update"""
+    if not request.alert_ids:
+        raise HTTPException(status_code=400, detail="No alert IDs provided")
+
+    updated = watchlist_service.acknowledge_alerts_bulk(db, request.alert_ids, acknowledged_by)
+    return {"message": f"{updated} alert(s) acknowledged", "acknowledged": updated}
+
+
 @router.post("/alerts/{alert_id}/acknowledge")
 def acknowledge_alert(
     alert_id: int,
@@ -171,6 +171,19 @@ class VisitorListResponse(BaseModel):
     page_size: int
 
 
+class VisitorBulkActionItem(BaseModel):
+    id: int
+    action: str  # check_in | check_out | cancel
+
+
+class VisitorBulkActionRequest(BaseModel):
+    actions: List[VisitorBulkActionItem]
+
+
+class VisitorBatchRequest(BaseModel):
+    ids: List[int]
+
+
 # ==================== Gate Verification Schemas ====================
 
 class GateVerificationRequest(BaseModel):
@@ -276,6 +289,10 @@ class WatchlistAlertAcknowledge(BaseModel):
     notes: Optional[str] = None
 
 
+class WatchlistAlertBulkAcknowledge(BaseModel):
+    alert_ids: List[int]
+
+
 class WatchlistAlertResolve(BaseModel):
     resolution_notes: str
     is_false_positive: bool = False
@@ -308,6 +325,10 @@ class IncidentUpdate(BaseModel):
     resolution_notes: Optional[str] = None
 
 
+class IncidentUpdateWithComment(IncidentUpdate):
+    comment: Optional[str] = None
+
+
 class IncidentResponse(IncidentBase):
     id: int
     incident_number: str
@@ -349,6 +370,10 @@ class IncidentListResponse(BaseModel):
     page_size: int
 
 
+class IncidentBatchRequest(BaseModel):
+    ids: List[int]
+
+
 # ==================== Dashboard Schemas ====================
 
 class DashboardStats(BaseModel):
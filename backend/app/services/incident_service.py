@@ -130,6 +130,11 @@ class IncidentService:
     def get_incident_by_number(db: Session, incident_number: str) -> Optional[Incident]:
         """Get incident by incident number"""
         return db.query(Incident).filter(Incident.incident_number == incident_number).first()
+
+    @staticmethod
+    def get_incidents_by_ids(db: Session, ids: List[int]) -> List[Incident]:
+        """Get several incidents in one query"""
+        return db.query(Incident).filter(Incident.id.in_(ids)).all()
     
     @staticmethod
     def get_incidents(
@@ -248,6 +253,66 @@ class IncidentService:
         
         return incident
     
+    @staticmethod
+    def update_with_comment(
+        db: Session,
+        incident_id: int,
+        update_data: IncidentUpdate,
+        comment: Optional[str],
+        updated_by: int
+    ) -> Optional[Incident]:
+        """Apply field updates and an optional comment atomically.
+
+        The update form used to send a PATCH followed by a comment POST -
+        two round trips with a window where the status changed but the
+        comment could be lost. This writes both in a single commit.
+        """
+        incident = db.query(Incident).filter(Incident.id == incident_id).first()
+        if not incident:
+            return None
+
+        update_dict = update_data.model_dump(exclude_unset=True)
+        changes = []
+
+        for field, value in update_dict.items():
+            old_value = getattr(incident, field)
+            if old_value != value:
+                changes.append(f"{field}: {old_value} → {value}")
+                setattr(incident, field, value)
+
+        # Handle status changes
+        if 'status' in update_dict:
+            if update_dict['status'] == IncidentStatus.RESOLVED:
+                incident.resolved_at = datetime.now(timezone.utc)
+                incident.resolved_by = updated_by
+
+        # Recalculate priority if severity changed
+        if 'severity' in update_dict:
+            incident.priority_score = IncidentService.calculate_priority_score(
+                update_dict['severity'],
+                incident.category.value
+            )
+
+        if changes:
+            db.add(IncidentTimeline(
+                incident_id=incident.id,
+                event_type="updated",
+                description=f"Updated: {', '.join(changes)}",
+                created_by=updated_by
+            ))
+        if comment:
+            db.add(IncidentTimeline(
+                incident_id=incident.id,
+                event_type="comment",
+                description=comment,
+                created_by=updated_by
+            ))
+
+        db.commit()
+        db.refresh(incident)
+
+        return incident
+
     @staticmethod
     def assign_incident(
         db: Session,
@@ -106,6 +106,11 @@ class VisitorService:
     def get_visitor_by_code(db: Session, approval_code: str) -> Optional[Visitor]:
         """Get visitor by approval code"""
         return db.query(Visitor).filter(Visitor.approval_code == approval_code).first()
+
+    @staticmethod
+    def get_visitors_by_ids(db: Session, ids: List[int]) -> List[Visitor]:
+        """Get several visitors in one query"""
+        return db.query(Visitor).filter(Visitor.id.in_(ids)).all()
     
     @staticmethod
     def get_visitors(
@@ -142,11 +147,17 @@ class VisitorService:
         return visitors, total
     
     @staticmethod
-    def get_active_visitors(db: Session) -> List[Visitor]:
+    def get_active_visitors(
+        db: Session,
+        visiting_unit: Optional[str] = None
+    ) -> List[Visitor]:
         """Get all currently active (checked-in) visitors"""
-        return db.query(Visitor).filter(
+        query = db.query(Visitor).filter(
             Visitor.status == VisitorStatus.CHECKED_IN
-        ).all()
+        )
+        if visiting_unit:
+            query = query.filter(Visitor.visiting_unit == visiting_unit)
+        return query.all()
     
     @staticmethod
     def get_todays_visitors(db: Session) -> List[Visitor]:
@@ -222,6 +233,54 @@ class VisitorService:
         db.refresh(visitor)
         return visitor
     
+    @staticmethod
+    def bulk_action(db: Session, actions: List[dict]) -> dict:
+        """
+        Apply check-in/check-out/cancel to several visitors in one call
+        Returns per-item results plus success/failure counts
+        """
+        handlers = {
+            "check_in": VisitorService.check_in_visitor,
+            "check_out": VisitorService.check_out_visitor,
+            "cancel": VisitorService.cancel_visitor,
+        }
+
+        results = []
+        succeeded = 0
+        failed = 0
+
+        for item in actions:
+            visitor_id = item.get("id")
+            action = item.get("action")
+            handler = handlers.get(action)
+
+            if not handler:
+                results.append({
+                    "id": visitor_id, "action": action,
+                    "success": False, "error": f"Unknown action: {action}"
+                })
+                failed += 1
+                continue
+
+            try:
+                visitor = handler(db, visitor_id)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Bulk action {action} failed for visitor {visitor_id}: {e}")
+                visitor = None
+
+            if visitor:
+                results.append({"id": visitor_id, "action": action, "success": True})
+                succeeded += 1
+            else:
+                results.append({
+                    "id": visitor_id, "action": action,
+                    "success": False, "error": "Visitor not found"
+                })
+                failed += 1
+
+        return {"succeeded": succeeded, "failed": failed, "results": results}
+
     @staticmethod
     def expire_old_approvals(db: Session) -> int:
         """Expire all approvals past their valid_until time"""
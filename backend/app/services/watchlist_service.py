@@ -87,6 +87,13 @@ class WatchlistService:
             WatchlistPerson.is_active == True
         ).all()
     
+    @staticmethod
+    def get_active_count(db: Session) -> int:
+        """Count active watchlist persons without loading any rows"""
+        return db.query(WatchlistPerson).filter(
+            WatchlistPerson.is_active == True
+        ).count()
+
     @staticmethod
     def get_watchlist(
         db: Session,
@@ -278,6 +285,28 @@ class WatchlistService:
         db.refresh(alert)
         return alert
     
+    @staticmethod
+    def acknowledge_alerts_bulk(
+        db: Session,
+        alert_ids: List[int],
+        acknowledged_by: int
+    ) -> int:
+        """Acknowledge several alerts in one UPDATE; returns rows updated"""
+        updated = db.query(WatchlistAlert).filter(
+            WatchlistAlert.id.in_(alert_ids),
+            WatchlistAlert.is_acknowledged == False
+        ).update(
+            {
+                "is_acknowledged": True,
+                "acknowledged_by": acknowledged_by,
+                "acknowledged_at": datetime.now(timezone.utc)
+            },
+            synchronize_session=False
+        )
+
+        db.commit()
+        return updated
+
     @staticmethod
     def resolve_alert(
         db: Session,
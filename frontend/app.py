@@ -17,7 +17,7 @@ if "api_base_url" not in st.session_state:
 from utils.permissions import (
     get_user_role, has_permission, get_accessible_pages,
     get_role_display_name, is_resident, is_receptionist,
-    is_security_staff, is_admin, Permission
+    is_security_staff, is_admin, page_allowed, Permission
 )
 
 # Custom CSS for dark mode compatible styling
@@ -472,7 +472,8 @@ def show_admin_dashboard():
                 <p>{name}</p>
             </div>
             """, unsafe_allow_html=True)
-            if st.button(f"Open", key=f"admin_{name}", use_container_width=True):
+            # One dict lookup against the session-cached page ACL
+            if page_allowed(page) and st.button(f"Open", key=f"admin_{name}", use_container_width=True):
                 st.switch_page(page)
     
     st.markdown("---")
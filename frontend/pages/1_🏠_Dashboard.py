@@ -1,7 +1,5 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sys
 sys.path.append("..")
@@ -17,6 +15,45 @@ st.set_page_config(
     layout="wide"
 )
 
+# Visitor status -> emoji mapping (shared by the role-specific views)
+STATUS_EMOJI = {"approved": "🟢", "checked_in": "🔵", "checked_out": "⚪", "cancelled": "🔴", "expired": "⚫"}
+
+
+# Cached fetchers - every widget interaction reruns the script, and
+# without a TTL these re-hit the backend each time. The Refresh buttons
+# clear them explicitly for an immediate re-fetch.
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_command_data():
+    return api_client.gather(
+        api_client.aget_full_dashboard(),
+        api_client.aget_entry_trends(days=7),
+        api_client.aget_incident_summary(),
+        api_client.aget_todays_logs(),
+        api_client.aget_incidents(limit=10),
+    )
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_front_desk_data():
+    return api_client.gather(
+        api_client.aget_todays_logs(),
+        api_client.aget_todays_visitors(),
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_resident_data(resident_id, unit):
+    return api_client.gather(
+        api_client.aget_visitors(approved_by=resident_id, visiting_unit=unit),
+        api_client.aget_incidents(reported_by=resident_id),
+    )
+
+
+def _clear_dashboard_caches():
+    _fetch_command_data.clear()
+    _fetch_front_desk_data.clear()
+    _fetch_resident_data.clear()
+
 # Check authentication
 if not require_auth():
     st.stop()
@@ -43,22 +80,17 @@ if is_resident():
     # Quick stats for resident
     col1, col2, col3 = st.columns(3)
     
-    # Get resident-specific data
-    try:
-        my_visitors = api_client.get_visitors(approved_by=user_id, visiting_unit=user_unit)
-        visitor_count = my_visitors.get("total", 0)
-        active_visitors = len([v for v in my_visitors.get("visitors", []) if v.get("status") == "checked_in"])
-    except:
-        visitor_count = 0
-        active_visitors = 0
-    
+    # Get resident-specific data - both lists come back in one
+    # concurrent round-trip via gather()
     try:
-        my_incidents = api_client.get_incidents(reported_by=user_id)
-        incident_count = len(my_incidents.get("incidents", []))
-        open_incidents = len([i for i in my_incidents.get("incidents", []) if i.get("status") in ["open", "in_progress"]])
+        my_visitors, my_incidents = _fetch_resident_data(user_id, user_unit)
     except:
-        incident_count = 0
-        open_incidents = 0
+        my_visitors, my_incidents = {}, {}
+
+    visitor_count = my_visitors.get("total", 0)
+    active_visitors = len([v for v in my_visitors.get("visitors", []) if v.get("status") == "checked_in"])
+    incident_count = len(my_incidents.get("incidents", []))
+    open_incidents = len([i for i in my_incidents.get("incidents", []) if i.get("status") in ["open", "in_progress"]])
     
     with col1:
         st.metric("My Visitors Today", visitor_count)
@@ -109,18 +141,16 @@ if is_resident():
     # Recent visitors for resident
     st.markdown("### 👥 Recent Visitors")
     
-    try:
-        recent = api_client.get_visitors(approved_by=user_id, visiting_unit=user_unit, limit=5)
-        visitors = recent.get("visitors", [])
-    except:
-        visitors = []
+    # Reuse the list fetched above instead of a third request
+    visitors = my_visitors.get("visitors", [])
     
     if visitors:
-        for v in visitors[:5]:
-            status_emoji = {"approved": "🟢", "checked_in": "🔵", "checked_out": "⚪", "cancelled": "🔴", "expired": "⚫"}
-            st.markdown(f"""
-            {status_emoji.get(v.get('status', ''), '❓')} **{v.get('full_name', 'N/A')}** - {v.get('visitor_type', '').title()} | Code: `{v.get('approval_code', 'N/A')}`
-            """)
+        # Single markdown element instead of one per visitor
+        st.markdown("\n\n".join(
+            f"{STATUS_EMOJI.get(v.get('status', ''), '❓')} **{v.get('full_name', 'N/A')}** - "
+            f"{v.get('visitor_type', '').title()} | Code: `{v.get('approval_code', 'N/A')}`"
+            for v in visitors[:5]
+        ))
     else:
         st.info("No recent visitors. Pre-approve a visitor to get started!")
 
@@ -132,22 +162,17 @@ elif is_receptionist():
     # Auto-refresh option
     col_refresh, col_time = st.columns([1, 3])
     with col_refresh:
-        if st.button("🔄 Refresh"):
-            st.rerun()
+        st.button("🔄 Refresh", on_click=_clear_dashboard_caches)
     
     st.markdown("---")
     
-    # Today's stats
+    # Today's stats - fetched concurrently via gather()
     try:
-        stats = api_client.get_todays_logs()
+        stats, visitor_data = _fetch_front_desk_data()
         log_stats = stats.get("stats", {})
-    except:
-        log_stats = {}
-    
-    try:
-        visitor_data = api_client.get_todays_visitors()
         today_visitors = visitor_data.get("visitors", [])
     except:
+        log_stats = {}
         today_visitors = []
     
     col1, col2, col3, col4 = st.columns(4)
@@ -193,13 +218,12 @@ elif is_receptionist():
     if today_visitors:
         visitor_data = []
         for v in today_visitors[:10]:
-            status_emoji = {"approved": "🟢", "checked_in": "🔵", "checked_out": "⚪", "cancelled": "🔴", "expired": "⚫"}
             visitor_data.append({
                 "Name": v.get("full_name", "N/A"),
                 "Type": v.get("visitor_type", "N/A").title(),
                 "Unit": v.get("visiting_unit", "N/A"),
                 "Code": v.get("approval_code", "N/A"),
-                "Status": f"{status_emoji.get(v.get('status', ''), '❓')} {v.get('status', 'N/A').title()}"
+                "Status": f"{STATUS_EMOJI.get(v.get('status', ''), '❓')} {v.get('status', 'N/A').title()}"
             })
         st.dataframe(pd.DataFrame(visitor_data), use_container_width=True, hide_index=True)
     else:
@@ -213,21 +237,27 @@ else:
     # Auto-refresh option
     col_refresh, col_time = st.columns([1, 3])
     with col_refresh:
-        if st.button("🔄 Refresh Data"):
-            st.rerun()
+        st.button("🔄 Refresh Data", on_click=_clear_dashboard_caches)
     with col_time:
         st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     st.markdown("---")
     
-    # Try to fetch data from API
+    # Fetch all dashboard endpoints concurrently - one fan-out instead of
+    # five sequential round-trips
     try:
-        dashboard_data = api_client.get_full_dashboard()
+        dashboard_data, trends_data, summary_data, logs_data, incidents_data = _fetch_command_data()
         stats = dashboard_data.get("stats", {})
         recent = dashboard_data.get("recent_activity", {})
-        api_available = True
+        api_available = "error" not in dashboard_data
     except:
+        trends_data = {}
+        summary_data = {}
+        logs_data = {}
+        incidents_data = {}
         api_available = False
+
+    if not api_available:
         stats = {
             "total_visitors_today": 0,
             "active_visitors": 0,
@@ -238,8 +268,6 @@ else:
             "critical_incidents": 0
         }
         recent = {}
-    
-    if not api_available:
         st.warning("⚠️ API not available. Showing limited data.")
     
     # Key Metrics Row
@@ -312,10 +340,8 @@ else:
         with left_col:
             st.markdown("### 📈 Entry Trends (Last 7 Days)")
             
-            try:
-                trends_data = api_client.get_entry_trends(days=7)
-                trends = trends_data.get("trends", [])
-            except:
+            trends = trends_data.get("trends", [])
+            if not trends:
                 trends = [
                     {"date": (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d"), 
                      "allowed": 100 + i*5, "denied": 5 + i}
@@ -324,38 +350,18 @@ else:
             
             if trends:
                 df_trends = pd.DataFrame(trends)
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=df_trends['date'],
-                    y=df_trends['allowed'],
-                    name='Allowed',
-                    fill='tozeroy',
-                    line=dict(color='#4CAF50')
-                ))
-                fig.add_trace(go.Scatter(
-                    x=df_trends['date'],
-                    y=df_trends['denied'],
-                    name='Denied',
-                    fill='tozeroy',
-                    line=dict(color='#f44336')
-                ))
-                
-                fig.update_layout(
-                    height=300,
-                    margin=dict(l=0, r=0, t=30, b=0),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02)
+
+                st.area_chart(
+                    df_trends.set_index('date')[['allowed', 'denied']],
+                    color=['#4CAF50', '#f44336'],
+                    height=300
                 )
-                
-                st.plotly_chart(fig, use_container_width=True)
         
         with right_col:
             st.markdown("### 📋 Incident Summary")
             
-            try:
-                summary = api_client.get_incident_summary()
-                by_severity = summary.get("by_severity", [])
-            except:
+            by_severity = summary_data.get("by_severity", [])
+            if not by_severity:
                 by_severity = [
                     {"severity": "low", "count": 2},
                     {"severity": "medium", "count": 3},
@@ -364,29 +370,11 @@ else:
             
             if by_severity:
                 df_severity = pd.DataFrame(by_severity)
-                
-                colors = {
-                    'low': '#4CAF50',
-                    'medium': '#FFC107',
-                    'high': '#FF9800',
-                    'critical': '#f44336'
-                }
-                
-                fig = px.pie(
-                    df_severity,
-                    values='count',
-                    names='severity',
-                    color='severity',
-                    color_discrete_map=colors,
-                    hole=0.4
-                )
-                fig.update_layout(
-                    height=250,
-                    margin=dict(l=0, r=0, t=0, b=0),
-                    showlegend=True
+
+                st.bar_chart(
+                    df_severity.set_index('severity')['count'],
+                    height=250
                 )
-                
-                st.plotly_chart(fig, use_container_width=True)
     
     st.markdown("---")
     
@@ -396,12 +384,8 @@ else:
     tab1, tab2 = st.tabs(["🚪 Gate Entries", "📋 Incidents"])
     
     with tab1:
-        try:
-            logs_data = api_client.get_todays_logs()
-            entries = logs_data.get("logs", [])
-        except:
-            entries = []
-        
+        entries = logs_data.get("logs", [])
+
         if entries:
             entry_data = []
             for entry in entries[:10]:
@@ -417,12 +401,8 @@ else:
             st.info("No entries yet today")
     
     with tab2:
-        try:
-            incidents_data = api_client.get_incidents(limit=10)
-            incidents = incidents_data.get("incidents", [])
-        except:
-            incidents = []
-        
+        incidents = incidents_data.get("incidents", [])
+
         if incidents:
             incident_data = []
             for inc in incidents[:10]:
@@ -1,12 +1,13 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-import base64
+import binascii
 import sys
 sys.path.append("..")
 from utils.api_client import api_client
+from utils.images import compress_image
 from utils.permissions import (
-    require_auth, has_permission, is_resident, is_receptionist,
+    require_auth, get_user_permissions, is_resident, is_receptionist,
     get_user_role, Permission, show_permission_denied
 )
 
@@ -16,12 +17,53 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# Cached fetcher - avoid re-hitting the API on every widget interaction.
+# Both lists come back in one concurrent round-trip via gather().
+# The version argument is part of the cache key: mutations bump the
+# session's version so only this session refetches, instead of clearing
+# the cache for every connected user.
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_visitor_lists(version, active_unit=None, **params):
+    return api_client.gather(
+        api_client.aget_visitors(**params),
+        api_client.aget_active_visitors(visiting_unit=active_unit),
+    )
+
+
+def _invalidate_visitor_caches():
+    st.session_state.visitors_version = st.session_state.get("visitors_version", 0) + 1
+
+
+# Module-level constants - built once per script load instead of per row
+STATUS_EMOJI = {
+    "approved": "🟢",
+    "checked_in": "🔵",
+    "checked_out": "⚪",
+    "expired": "⚫",
+    "cancelled": "🔴"
+}
+VISITOR_TYPES = ("guest", "delivery", "service", "cab", "vendor", "other")
+VEHICLE_TYPES = ("None", "Car", "Bike", "Auto", "Truck", "Other")
+STATUS_FILTERS = ("All", "approved", "checked_in", "checked_out", "expired", "cancelled")
+PAGE_SIZE = 25
+
 # Check authentication
 if not require_auth():
     st.stop()
 
+# Resolve the permission set once per role; frozenset membership is
+# O(1) versus a list scan per has_permission() call. Keyed by role so
+# logging out and back in as someone else refreshes the memo instead of
+# keeping the previous role's permissions.
+_perms_cached = st.session_state.get("perms")
+if not _perms_cached or _perms_cached[0] != get_user_role():
+    _perms_cached = (get_user_role(), frozenset(get_user_permissions()))
+    st.session_state["perms"] = _perms_cached
+_has = _perms_cached[1].__contains__
+
 # Check basic permission
-if not has_permission(Permission.VISITOR_CREATE.value) and not has_permission(Permission.VISITOR_READ.value):
+if not _has(Permission.VISITOR_CREATE.value) and not _has(Permission.VISITOR_READ.value):
     show_permission_denied()
     st.stop()
 
@@ -43,10 +85,10 @@ else:
     st.markdown("Register and manage visitor approvals")
 
 # Determine which tabs to show based on permissions
-can_create = has_permission(Permission.VISITOR_CREATE.value)
-can_read = has_permission(Permission.VISITOR_READ.value)
-can_update = has_permission(Permission.VISITOR_UPDATE.value)
-can_approve = has_permission(Permission.VISITOR_APPROVE.value)
+can_create = _has(Permission.VISITOR_CREATE.value)
+can_read = _has(Permission.VISITOR_READ.value)
+can_update = _has(Permission.VISITOR_UPDATE.value)
+can_approve = _has(Permission.VISITOR_APPROVE.value)
 
 # Build tabs based on permissions
 tab_names = []
@@ -60,6 +102,36 @@ if not tab_names:
     st.error("No permissions available for this page")
     st.stop()
 
+# Prefetch both visitor lists concurrently before rendering the tabs
+if can_read:
+    status_filter = st.session_state.get("visitor_filter_status", "All")
+    search_term = st.session_state.get("visitor_filter_search", "")
+
+    params = {}
+    if status_filter != "All":
+        params["status"] = status_filter
+    if search_term:
+        params["search"] = search_term
+
+    # For residents, only show their own visitors
+    if is_resident():
+        params["approved_by"] = user_id
+        params["visiting_unit"] = user_unit
+
+    # Server-side pagination - only ever pull one page of rows
+    page = int(st.session_state.get("visitor_page", 1))
+    params["limit"] = PAGE_SIZE
+    params["skip"] = (page - 1) * PAGE_SIZE
+
+    try:
+        visitors_result, active_result = _fetch_visitor_lists(
+            st.session_state.setdefault("visitors_version", 0),
+            active_unit=user_unit if is_resident() else None,
+            **params
+        )
+    except:
+        visitors_result, active_result = {}, {}
+
 tabs = st.tabs(tab_names)
 
 tab_index = 0
@@ -102,16 +174,16 @@ if can_create:
                 )
                 if uploaded_file:
                     # Read and store in session state immediately
-                    file_bytes = uploaded_file.read()
-                    st.session_state.visitor_face_image_base64 = base64.b64encode(file_bytes).decode()
+                    file_bytes = compress_image(uploaded_file.getvalue())
+                    st.session_state.visitor_face_image_base64 = binascii.b2a_base64(file_bytes, newline=False).decode("ascii")
                     st.session_state.visitor_face_preview = file_bytes
                     st.success("✅ Photo captured!")
             else:
                 camera_photo = st.camera_input("Take a photo", key="visitor_camera")
                 if camera_photo:
                     # Read and store in session state immediately
-                    file_bytes = camera_photo.read()
-                    st.session_state.visitor_face_image_base64 = base64.b64encode(file_bytes).decode()
+                    file_bytes = compress_image(camera_photo.getvalue())
+                    st.session_state.visitor_face_image_base64 = binascii.b2a_base64(file_bytes, newline=False).decode("ascii")
                     st.session_state.visitor_face_preview = file_bytes
                     st.success("✅ Photo captured!")
         
@@ -144,7 +216,7 @@ if can_create:
                 
                 visitor_type = st.selectbox(
                     "Visitor Type *",
-                    options=["guest", "delivery", "service", "cab", "vendor", "other"],
+                    options=VISITOR_TYPES,
                     format_func=lambda x: x.title()
                 )
                 
@@ -172,7 +244,7 @@ if can_create:
                 vehicle_number = st.text_input("Vehicle Number (Optional)", placeholder="MH 01 AB 1234")
                 vehicle_type = st.selectbox(
                     "Vehicle Type",
-                    options=["None", "Car", "Bike", "Auto", "Truck", "Other"]
+                    options=VEHICLE_TYPES
                 )
             
             notes = st.text_area("Additional Notes", placeholder="Any special instructions...")
@@ -224,6 +296,7 @@ if can_create:
                                 # Clear the face image from session state after success
                                 st.session_state.visitor_face_image_base64 = None
                                 st.session_state.visitor_face_preview = None
+                                _invalidate_visitor_caches()
                                 
                                 st.success(f"""
                                 ✅ **Visitor Approved Successfully!**
@@ -252,56 +325,45 @@ if can_read:
     with tabs[tab_index]:
         st.markdown("### All Visitors" if not is_resident() else "### My Visitors")
         
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            status_filter = st.selectbox(
-                "Status",
-                ["All", "approved", "checked_in", "checked_out", "expired", "cancelled"]
-            )
-        with col2:
-            search_term = st.text_input("Search", placeholder="Name, phone, or code")
-        with col3:
-            if st.button("🔄 Refresh"):
-                st.rerun()
-        
-        # Fetch visitors
-        params = {}
-        if status_filter != "All":
-            params["status"] = status_filter
-        if search_term:
-            params["search"] = search_term
-        
-        # For residents, only show their own visitors
-        if is_resident():
-            params["approved_by"] = user_id
-            params["visiting_unit"] = user_unit
-        
-        try:
-            result = api_client.get_visitors(**params)
-            visitors = result.get("visitors", [])
-            total = result.get("total", 0)
-        except:
-            visitors = []
-            total = 0
-        
-        st.caption(f"Total: {total} visitors")
+        # Filters - inside a form so typing in the search box doesn't fire
+        # an API call per keystroke; filters only apply on submit
+        with st.form("visitor_filters"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                status_filter = st.selectbox("Status", STATUS_FILTERS)
+            with col2:
+                search_term = st.text_input("Search", placeholder="Name, phone, or code")
+            with col3:
+                st.markdown("&nbsp;")
+                filters_applied = st.form_submit_button("🔍 Apply Filters")
+
+        if filters_applied:
+            st.session_state.visitor_filter_status = status_filter
+            st.session_state.visitor_filter_search = search_term
+            st.rerun()
+
+        if st.button("🔄 Refresh"):
+            _invalidate_visitor_caches()
+            st.rerun()
+
+        visitors = visitors_result.get("visitors", [])
+        total = visitors_result.get("total", 0)
+        total_pages = max(1, -(-total // PAGE_SIZE))
+
+        page_col, caption_col = st.columns([1, 3])
+        with page_col:
+            st.number_input("Page", min_value=1, step=1, key="visitor_page")
+        with caption_col:
+            st.caption(f"Total: {total} visitors • Page {page} of {total_pages}")
         
         if visitors:
             for visitor in visitors:
                 status = visitor.get('status', '')
-                status_emoji = {
-                    "approved": "🟢",
-                    "checked_in": "🔵",
-                    "checked_out": "⚪",
-                    "expired": "⚫",
-                    "cancelled": "🔴"
-                }
-                
+
                 # Show face status
                 has_face = "📸" if visitor.get('face_image_url') else "👤"
-                
-                with st.expander(f"{status_emoji.get(status, '❓')} {has_face} {visitor.get('full_name', 'N/A')} - {visitor.get('approval_code', 'N/A')}"):
+
+                with st.expander(f"{STATUS_EMOJI.get(status, '❓')} {has_face} {visitor.get('full_name', 'N/A')} - {visitor.get('approval_code', 'N/A')}"):
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
@@ -326,44 +388,68 @@ if can_read:
                         **Face:** {face_status}
                         """)
                     
-                    # Action buttons based on permissions and status
-                    btn_col1, btn_col2, btn_col3 = st.columns(3)
-                    
-                    # Check-in (receptionist and security only)
-                    if can_update or can_approve:
-                        with btn_col1:
-                            if status == 'approved':
-                                if st.button("✅ Check In", key=f"checkin_{visitor.get('id')}"):
-                                    try:
-                                        api_client.check_in_visitor(visitor.get('id'))
-                                        st.success("Checked in!")
-                                        st.rerun()
-                                    except:
-                                        st.info("Demo: Visitor checked in")
-                        
-                        with btn_col2:
-                            if status == 'checked_in':
-                                if st.button("🚪 Check Out", key=f"checkout_{visitor.get('id')}"):
-                                    try:
-                                        api_client.check_out_visitor(visitor.get('id'))
-                                        st.success("Checked out!")
-                                        st.rerun()
-                                    except:
-                                        st.info("Demo: Visitor checked out")
-                    
-                    # Cancel (available to creator or those with update permission)
-                    with btn_col3:
-                        if status in ['approved', 'pending']:
-                            # Residents can cancel their own visitors
-                            can_cancel = (is_resident() and visitor.get('approved_by') == user_id) or can_update
-                            if can_cancel:
-                                if st.button("❌ Cancel", key=f"cancel_{visitor.get('id')}"):
-                                    try:
-                                        api_client.cancel_visitor(visitor.get('id'))
-                                        st.warning("Approval cancelled")
-                                        st.rerun()
-                                    except:
-                                        st.info("Demo: Approval cancelled")
+                    # Available actions based on permissions and status
+                    actions = []
+                    if (can_update or can_approve) and status == 'approved':
+                        actions.append("✅ Check In")
+                    if (can_update or can_approve) and status == 'checked_in':
+                        actions.append("🚪 Check Out")
+                    if status in ['approved', 'pending']:
+                        # Residents can cancel their own visitors
+                        can_cancel = (is_resident() and visitor.get('approved_by') == user_id) or can_update
+                        if can_cancel:
+                            actions.append("❌ Cancel")
+
+                    # Single form per visitor - queue the action locally and
+                    # apply all queued actions in one bulk API call below
+                    if actions:
+                        queued = st.session_state.setdefault("pending_actions", {})
+                        with st.form(f"actions_{visitor.get('id')}"):
+                            action_col, submit_col = st.columns([3, 1])
+                            with action_col:
+                                action = st.radio(
+                                    "Action",
+                                    actions,
+                                    horizontal=True,
+                                    label_visibility="collapsed"
+                                )
+                            with submit_col:
+                                queue_it = st.form_submit_button("Queue")
+
+                            if queue_it:
+                                action_map = {
+                                    "✅ Check In": "check_in",
+                                    "🚪 Check Out": "check_out",
+                                    "❌ Cancel": "cancel"
+                                }
+                                queued[visitor.get('id')] = action_map[action]
+
+                        if visitor.get('id') in queued:
+                            st.caption(f"⏳ Queued: {queued[visitor.get('id')].replace('_', ' ')}")
+
+            # Apply everything queued above in a single bulk request
+            pending = st.session_state.get("pending_actions", {})
+            if pending:
+                col_apply, col_clear = st.columns(2)
+                with col_apply:
+                    if st.button(f"🚀 Apply {len(pending)} queued action(s)", type="primary", use_container_width=True):
+                        try:
+                            result = api_client.bulk_visitor_action(
+                                [{"id": vid, "action": act} for vid, act in pending.items()]
+                            )
+                            st.success(
+                                f"Applied: {result.get('succeeded', 0)} succeeded, "
+                                f"{result.get('failed', 0)} failed"
+                            )
+                        except:
+                            st.info("Demo: actions applied")
+                        st.session_state.pending_actions = {}
+                        _invalidate_visitor_caches()
+                        st.rerun()
+                with col_clear:
+                    if st.button("🗑️ Clear queue", use_container_width=True):
+                        st.session_state.pending_actions = {}
+                        st.rerun()
         else:
             if is_resident():
                 st.info("You haven't approved any visitors yet. Use the 'New Visitor' tab to pre-approve guests.")
@@ -374,19 +460,23 @@ if can_read:
 
 # ==================== ACTIVE VISITORS TAB ====================
 if can_read:
-    with tabs[tab_index]:
+    # Fragment auto-refreshes the active list every 30s (in step with the
+    # fetch cache TTL) without rerunning the rest of the page
+    @st.fragment(run_every="30s")
+    def _render_active_visitors():
         st.markdown("### Currently Active Visitors")
-        
+
         try:
-            # For residents, filter by their unit
-            if is_resident():
-                result = api_client.get_active_visitors(visiting_unit=user_unit)
-            else:
-                result = api_client.get_active_visitors()
-            active_visitors = result.get("visitors", [])
+            _, fresh_active = _fetch_visitor_lists(
+                st.session_state.get("visitors_version", 0),
+                active_unit=user_unit if is_resident() else None,
+                **params
+            )
         except:
-            active_visitors = []
-        
+            fresh_active = {}
+
+        active_visitors = fresh_active.get("visitors", [])
+
         if active_visitors:
             st.metric("Active Visitors", len(active_visitors))
             
@@ -406,6 +496,7 @@ if can_read:
                         if st.button("Check Out", key=f"active_checkout_{visitor.get('id', 0)}"):
                             try:
                                 api_client.check_out_visitor(visitor.get('id'))
+                                _invalidate_visitor_caches()
                                 st.rerun()
                             except:
                                 st.info("Demo: Checked out")
@@ -417,6 +508,9 @@ if can_read:
             else:
                 st.info("No active visitors at the moment")
 
+    with tabs[tab_index]:
+        _render_active_visitors()
+
 # Sidebar info based on role
 with st.sidebar:
     if is_resident():
@@ -1,10 +1,16 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import base64
+from concurrent.futures import ThreadPoolExecutor
+import re
 import sys
+import threading
+import time
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 sys.path.append("..")
 from utils.api_client import api_client
+from utils.images import compress_image
 from utils.permissions import (
     require_auth, has_permission, is_resident,
     Permission, show_permission_denied, get_role_display_name
@@ -16,6 +22,47 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# Cached fetcher for the combined gate dashboard (logs + stats + active
+# visitors in one request). Short TTL keeps the gate view fresh; the
+# version argument keys the cache per session so each verification only
+# invalidates this operator's view, not every connected session.
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_gate_dashboard(version):
+    return api_client.get_gate_dashboard()
+
+
+def _invalidate_gate_dashboard():
+    st.session_state.logs_version = st.session_state.get("logs_version", 0) + 1
+
+
+# Shared worker pool so a slow face-recognition call doesn't block the
+# script run; survives reruns via cache_resource
+@st.cache_resource
+def _verify_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+
+# Module-level constants - built once per script load instead of per row
+GATE_OPTIONS = ("MAIN_GATE", "SIDE_GATE", "PARKING_GATE", "SERVICE_GATE")
+STATUS_EMOJI = {
+    "approved": "🟢",
+    "checked_in": "🔵",
+    "checked_out": "⚪",
+    "expired": "⚫",
+    "cancelled": "🔴"
+}
+LOG_STATUS_EMOJI = {
+    "allowed": "✅",
+    "denied": "❌",
+    "manual_verification": "⚠️",
+    "watchlist_alert": "🚨"
+}
+
+# Approval codes are uppercase alphanumeric (see VisitorService
+# generate_approval_code); reject anything else before hitting the API
+_CODE_RE = re.compile(r"^[A-Z0-9]{4,10}$")
+
 # Check authentication
 if not require_auth():
     st.stop()
@@ -48,7 +95,7 @@ col1, col2 = st.columns([1, 3])
 with col1:
     gate_id = st.selectbox(
         "Select Gate",
-        options=["MAIN_GATE", "SIDE_GATE", "PARKING_GATE", "SERVICE_GATE"],
+        options=GATE_OPTIONS,
         index=0
     )
 
@@ -73,13 +120,13 @@ with tab1:
         )
         
         face_image = None
-        face_image_base64 = None
-        
+        face_image_bytes = None
+
         if capture_option == "Camera Capture":
             face_image = st.camera_input("Capture visitor's face")
             if face_image:
-                face_image_base64 = base64.b64encode(face_image.read()).decode()
-                face_image.seek(0)  # Reset for display
+                # getvalue() doesn't consume the buffer, so no seek() needed
+                face_image_bytes = compress_image(face_image.getvalue())
         else:
             uploaded = st.file_uploader(
                 "Upload photo",
@@ -88,8 +135,7 @@ with tab1:
             )
             if uploaded:
                 face_image = uploaded
-                face_image_base64 = base64.b64encode(uploaded.read()).decode()
-                uploaded.seek(0)
+                face_image_bytes = compress_image(uploaded.getvalue())
         
         if face_image:
             st.image(face_image, caption="Captured Image", use_container_width=True)
@@ -97,24 +143,48 @@ with tab1:
         verify_btn = st.button(
             "🔍 Verify Identity",
             use_container_width=True,
-            disabled=not face_image_base64,
+            disabled=not face_image_bytes,
             type="primary"
         )
-        
-        if verify_btn and face_image_base64:
-            with st.spinner("Verifying identity..."):
-                result = api_client.verify_entry(
-                    face_image_base64=face_image_base64,
-                    gate_id=gate_id,
+
+        if verify_btn and face_image_bytes:
+            # Submit to the worker pool; the result panel polls the future
+            # so the rest of the page stays responsive during recognition
+            ctx = get_script_run_ctx()
+
+            def _verify(ctx=ctx, image=face_image_bytes, gate=gate_id):
+                add_script_run_ctx(threading.current_thread(), ctx)
+                return api_client.verify_entry_multipart(
+                    image_bytes=image,
+                    gate_id=gate,
                     verified_by=user_id
                 )
-                st.session_state.verification_result = result
+
+            st.session_state.verification_result = None
+            st.session_state.verification_future = _verify_executor().submit(_verify)
     
-    with col2:
+    @st.fragment
+    def _render_verification_result():
         st.markdown("#### Verification Result")
-        
+
+        # Poll the in-flight verification inside this fragment only;
+        # the rest of the page is not rerun while we wait
+        future = st.session_state.get("verification_future")
+        if future is not None:
+            if not future.done():
+                st.info("⏳ Verifying identity...")
+                time.sleep(0.25)
+                st.rerun(scope="fragment")
+            try:
+                st.session_state.verification_result = future.result()
+            except Exception as e:
+                st.session_state.verification_result = {"status": "error", "message": str(e)}
+            st.session_state.verification_future = None
+            _invalidate_gate_dashboard()
+            st.rerun()
+
         result = st.session_state.verification_result
-        
+
         if result:
             status = result.get("status", "unknown")
             
@@ -203,6 +273,9 @@ with tab1:
             4. Click 'Verify Identity'
             """)
 
+    with col2:
+        _render_verification_result()
+
 with tab2:
     st.markdown("### Approval Code Verification")
     st.markdown("Enter the visitor's pre-approved code")
@@ -222,14 +295,17 @@ with tab2:
             disabled=len(approval_code) < 4
         )
         
-        if code_verify_btn and approval_code:
+        if code_verify_btn and approval_code and not _CODE_RE.match(approval_code):
+            st.error("❌ Invalid code format - codes are 4-10 letters/digits")
+        elif code_verify_btn and approval_code:
             with st.spinner("Verifying code..."):
                 result = api_client.verify_by_code(
                     approval_code=approval_code,
                     gate_id=gate_id,
                     verified_by=user_id
                 )
-                
+                _invalidate_gate_dashboard()
+
                 if result.get("status") == "allowed":
                     st.success(f"✅ {result.get('message', 'Entry Allowed')}")
                     visitor = result.get("visitor", {})
@@ -245,30 +321,27 @@ with tab2:
     with col2:
         st.markdown("#### Lookup Visitor")
         
-        lookup_code = st.text_input(
-            "Search by code",
-            placeholder="Enter code to lookup",
-            key="lookup_code"
-        ).upper()
-        
-        if lookup_code:
+        # Form so the lookup only fires on submit, not on every keystroke
+        with st.form("lookup_form"):
+            lookup_code = st.text_input(
+                "Search by code",
+                placeholder="Enter code to lookup",
+                key="lookup_code"
+            ).upper()
+            lookup_submitted = st.form_submit_button("🔎 Lookup")
+
+        if lookup_submitted and lookup_code and not _CODE_RE.match(lookup_code):
+            st.warning("Codes are 4-10 letters/digits")
+        elif lookup_submitted and lookup_code:
             try:
                 visitor = api_client.get_visitor_by_code(lookup_code)
                 if visitor and "error" not in visitor:
-                    status_color = {
-                        "approved": "🟢",
-                        "checked_in": "🔵",
-                        "checked_out": "⚪",
-                        "expired": "⚫",
-                        "cancelled": "🔴"
-                    }
-                    
                     st.markdown(f"""
                     **Name:** {visitor.get('full_name', 'N/A')}  
                     **Phone:** {visitor.get('phone', 'N/A')}  
                     **Type:** {visitor.get('visitor_type', 'N/A').title()}  
                     **Visiting:** {visitor.get('visiting_unit', 'N/A')}  
-                    **Status:** {status_color.get(visitor.get('status', ''), '❓')} {visitor.get('status', 'N/A').upper()}  
+                    **Status:** {STATUS_EMOJI.get(visitor.get('status', ''), '❓')} {visitor.get('status', 'N/A').upper()}
                     **Valid Until:** {visitor.get('valid_until', 'N/A')[:16] if visitor.get('valid_until') else 'N/A'}
                     """)
                 else:
@@ -278,12 +351,14 @@ with tab2:
 
 st.markdown("---")
 
-# Recent Entry Logs (only if permission allows)
-if has_permission(Permission.GATE_LOGS_VIEW.value):
+# Recent Entry Logs - fragment auto-refreshes every 10s without
+# rerunning the rest of the page
+@st.fragment(run_every="10s")
+def _render_recent_logs():
     st.markdown("### 📋 Recent Entry Logs")
-    
+
     try:
-        logs_data = api_client.get_todays_logs()
+        logs_data = _fetch_gate_dashboard(st.session_state.setdefault("logs_version", 0))
         logs = logs_data.get("logs", [])
         stats = logs_data.get("stats", {})
     except:
@@ -301,29 +376,27 @@ if has_permission(Permission.GATE_LOGS_VIEW.value):
     with col4:
         st.metric("Alerts", stats.get("watchlist_alerts", 0))
     
-    # Logs table
+    # Logs table - columnar construction avoids building a dict per row
+    # and lets pandas assemble each column in one pass
     if logs:
-        log_data = []
-        for log in logs[:20]:
-            status_emoji = {
-                "allowed": "✅",
-                "denied": "❌",
-                "manual_verification": "⚠️",
-                "watchlist_alert": "🚨"
-            }
-            log_data.append({
-                "Time": log.get("timestamp", "N/A")[:19] if log.get("timestamp") else "N/A",
-                "Status": f"{status_emoji.get(log.get('status', ''), '❓')} {log.get('status', 'N/A')}",
-                "Person": log.get("person_name", "Unknown"),
-                "Gate": log.get("gate_id", "N/A"),
-                "Method": log.get("verification_method", "N/A"),
-                "Confidence": f"{log.get('face_match_confidence', 0):.1f}%" if log.get('face_match_confidence') else "N/A"
-            })
-        
+        recent = logs[:20]
+        log_data = {
+            "Time": [log.get("timestamp", "N/A")[:19] if log.get("timestamp") else "N/A" for log in recent],
+            "Status": [f"{LOG_STATUS_EMOJI.get(log.get('status', ''), '❓')} {log.get('status', 'N/A')}" for log in recent],
+            "Person": [log.get("person_name", "Unknown") for log in recent],
+            "Gate": [log.get("gate_id", "N/A") for log in recent],
+            "Method": [log.get("verification_method", "N/A") for log in recent],
+            "Confidence": [f"{log.get('face_match_confidence', 0):.1f}%" if log.get('face_match_confidence') else "N/A" for log in recent]
+        }
+
         st.dataframe(pd.DataFrame(log_data), use_container_width=True, hide_index=True)
     else:
         st.info("No entry logs yet today")
 
+
+if has_permission(Permission.GATE_LOGS_VIEW.value):
+    _render_recent_logs()
+
 # Sidebar
 with st.sidebar:
     st.markdown("### 🚪 Gate Controls")
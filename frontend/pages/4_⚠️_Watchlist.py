@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import base64
-import os
+from io import BytesIO
 import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from PIL import Image
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 sys.path.append("..")
 from utils.api_client import api_client
+from utils.constants import SEVERITIES, TITLE as _title, WATCHLIST_CATEGORIES
+from utils.images import compress_image
 from utils.permissions import (
     require_auth, has_permission, is_resident, is_security_staff, is_admin,
     Permission, show_permission_denied, get_role_display_name
@@ -17,6 +26,121 @@ st.set_page_config(
     layout="wide"
 )
 
+# Shared lookup tables - built once at import instead of per row per rerun
+SEVERITY_ICONS = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+CATEGORY_OPTIONS = ("All",) + WATCHLIST_CATEGORIES
+SEVERITY_OPTIONS = ("All",) + SEVERITIES
+ADD_CATEGORY_OPTIONS = WATCHLIST_CATEGORIES + ("other",)
+ADD_SEVERITY_OPTIONS = SEVERITIES
+WATCHLIST_PAGE_SIZE = 20
+ALERTS_PAGE_SIZE = 25
+
+
+def _norm_alert(a):
+    """Normalize one alert dict so the render path does plain key lookups
+    instead of repeated .get chains and ternaries per field"""
+    ts = a.get("created_at") or ""
+    return {
+        "id": a.get("id"),
+        "name": a.get("watchlist_person_name") or "Unknown",
+        "category": (a.get("category") or "N/A").title(),
+        "severity": (a.get("severity") or "medium").upper(),
+        "gate": a.get("gate_id") or "N/A",
+        "confidence": a.get("confidence_score") or 0,
+        "acknowledged": bool(a.get("is_acknowledged")),
+        "time": ts[:19] if ts else "N/A",
+    }
+
+
+def _norm_person(p):
+    """Normalize one watchlist person dict - same single-pass binding as
+    _norm_alert, so the table and detail panel do plain key lookups"""
+    created = p.get("created_at") or ""
+    return {
+        "id": p.get("id"),
+        "severity": p.get("severity") or "medium",
+        "name": p.get("full_name") or "N/A",
+        "alias": p.get("alias") or "",
+        "phone": p.get("phone") or "N/A",
+        "category": (p.get("category") or "N/A").title(),
+        "face_image_url": p.get("face_image_url"),
+        "reason": p.get("reason") or "",
+        "added": created[:10] if created else "N/A",
+    }
+
+
+# Cached fetchers with TTLs scaled to how live each dataset is: alerts
+# need to be fresh, the watchlist itself changes rarely, history is
+# effectively static. Cleared in the mutation handlers below.
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_alerts():
+    return api_client.get_active_alerts()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_watchlist(**params):
+    return api_client.get_watchlist(**params)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_history():
+    return api_client.get_alerts(is_resolved=True, limit=20)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_watchlist_count():
+    return api_client.get_watchlist_count()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _history_frame(sig, _rows):
+    """Build the resolved-alerts frame once per distinct history.
+
+    ``sig`` is a cheap (id, resolved_at) signature; ``_rows`` is
+    underscore-prefixed so Streamlit skips hashing the full payload and
+    only reconstructs the DataFrame when the signature changes.
+    """
+    df = pd.DataFrame(_rows)
+    df["Confidence"] = df["confidence_score"].fillna(0).map("{:.1f}%".format)
+    df["False Positive"] = df["is_false_positive"].map({True: "Yes", False: "No"}).fillna("No")
+    df["Created"] = df["created_at"].astype(str).str.slice(0, 16)
+    df["Resolved"] = df["resolved_at"].astype(str).str.slice(0, 16)
+    return (
+        df[["watchlist_person_name", "severity", "Confidence", "False Positive", "Created", "Resolved"]]
+        .rename(columns={"watchlist_person_name": "Person", "severity": "Severity"})
+    )
+
+
+# Thumbnail cache - full-size photos are only decoded once and shipped
+# to the browser at display size
+@st.cache_data(show_spinner=False, max_entries=256)
+def _load_thumbnail(image_path):
+    try:
+        img = Image.open(image_path)
+        img.thumbnail((150, 150))
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        buf = BytesIO()
+        img.save(buf, format="JPEG", quality=80)
+        return buf.getvalue()
+    except Exception:
+        return None
+
+
+# Raw photo bytes live in a cache_resource-backed dict keyed by a
+# per-session token; session_state only carries the token, so reruns
+# never clone megabytes of image data
+@st.cache_resource
+def _photo_store():
+    return {}
+
+
+# One pool reused across reruns instead of constructing and joining a
+# fresh ThreadPoolExecutor per script run
+@st.cache_resource
+def _fetch_executor():
+    return ThreadPoolExecutor(max_workers=3)
+
 # Check authentication
 if not require_auth():
     st.stop()
@@ -45,30 +169,93 @@ can_update = has_permission(Permission.WATCHLIST_UPDATE.value)
 can_delete = has_permission(Permission.WATCHLIST_DELETE.value)
 can_view_alerts = has_permission(Permission.WATCHLIST_ALERTS.value)
 
-# Helper function to resolve image paths
+# The three datasets are independent, so fetch them concurrently - the
+# page blocks for the slowest call instead of the sum of all three.
+# Filter widgets are keyed, so session_state already holds the values
+# they will render with this run.
+_ctx = get_script_run_ctx()
+
+
+def _submit(fn, *args, **kwargs):
+    def _run():
+        add_script_run_ctx(threading.current_thread(), _ctx)
+        return fn(*args, **kwargs)
+    return _fetch_executor().submit(_run)
+
+
+# Search runs server-side so it covers the whole list, not just the
+# current page; a new term jumps back to page 1
+_wl_search = st.session_state.get("wl_search", "").strip()
+if _wl_search != st.session_state.get("_wl_last_search", ""):
+    st.session_state["_wl_last_search"] = _wl_search
+    st.session_state["watchlist_page"] = 1
+
+watchlist_params = {
+    "is_active": True,
+    "skip": (int(st.session_state.get("watchlist_page", 1)) - 1) * WATCHLIST_PAGE_SIZE,
+    "limit": WATCHLIST_PAGE_SIZE,
+}
+if st.session_state.get("wl_category", "All") != "All":
+    watchlist_params["category"] = st.session_state["wl_category"]
+if st.session_state.get("wl_severity", "All") != "All":
+    watchlist_params["severity"] = st.session_state["wl_severity"]
+if _wl_search:
+    watchlist_params["search"] = _wl_search
+
+# Session-held snapshots keyed by filter tuple: switching tabs (or any
+# other widget interaction) reuses the parsed response instead of going
+# back through the cache layer, which may have expired mid-session.
+# Mutation callbacks pop these alongside the cache clears.
+_SNAPSHOT_TTL = {"alerts_snap": 15, "watchlist_snap": 30}
+
+
+def _snap_get(name, key):
+    snap = st.session_state.get(name)
+    if snap and snap[0] == key and time.time() - snap[1] <= _SNAPSHOT_TTL[name]:
+        return snap[2]
+    return None
+
+
+def _snap_put(name, key, value):
+    st.session_state[name] = (key, time.time(), value)
+
+
+wl_key = tuple(sorted(watchlist_params.items()))
+alerts_snap = _snap_get("alerts_snap", ()) if can_view_alerts else None
+watchlist_snap = _snap_get("watchlist_snap", wl_key)
+
+f_alerts = _submit(_fetch_alerts) if can_view_alerts and alerts_snap is None else None
+f_watchlist = _submit(_fetch_watchlist, **watchlist_params) if watchlist_snap is None else None
+f_history = (
+    _submit(_fetch_history)
+    if can_view_alerts and st.session_state.get("hist_loaded")
+    else None
+)
+
+# Candidate roots for backend-relative image URLs, resolved once at
+# import. "." covers absolute URLs and paths relative to the cwd.
+_IMG_BASES = tuple(Path(p).resolve() for p in (
+    ".",
+    "../backend",
+    "../../backend",
+    "/home/priyanshu/Desktop/Hackathon/backend",
+))
+
+
+# Helper function to resolve image paths. Each call stats up to four
+# filesystem paths, so memoize per URL - entries are tiny strings and
+# the result only changes if backend storage moves.
+@st.cache_data(show_spinner=False, max_entries=1024)
 def get_valid_image_path(image_url):
     """Resolve image path - handles relative paths from backend"""
     if not image_url:
         return None
-    
-    if os.path.isabs(image_url) and os.path.exists(image_url):
-        return image_url
-    
-    if os.path.exists(image_url):
-        return image_url
-    
-    possible_bases = [
-        "../backend",
-        "../../backend",
-        "/home/priyanshu/Desktop/Hackathon/backend",
-        ".",
-    ]
-    
-    for base in possible_bases:
-        full_path = os.path.join(base, image_url)
-        if os.path.exists(full_path):
-            return full_path
-    
+
+    for base in _IMG_BASES:
+        full_path = base / image_url
+        if full_path.is_file():
+            return str(full_path)
+
     return None
 
 # Build tabs based on permissions
@@ -83,85 +270,154 @@ tabs = st.tabs(tab_names)
 
 tab_index = 0
 
+# Mutations run as on_click callbacks: the API call and cache clear
+# happen before Streamlit's own single post-callback rerun, so there is
+# no second forced rerun of the whole page. Outcome messages are stashed
+# as flashes and shown on the following run.
+def _ack_selected(alert_ids):
+    try:
+        api_client.acknowledge_alerts_bulk(alert_ids, user_id)
+        st.session_state["alerts_flash"] = f"{len(alert_ids)} alert(s) acknowledged"
+    except:
+        st.session_state["alerts_flash"] = "Demo: Alerts acknowledged"
+    st.session_state.pop("alerts_snap", None)
+    _fetch_alerts.clear()
+
+
+def _resolve_selected(alert_id):
+    try:
+        api_client.resolve_alert(
+            alert_id,
+            user_id,
+            st.session_state.get("resolve_notes", ""),
+            st.session_state.get("resolve_fp", False)
+        )
+        st.session_state["alerts_flash"] = "Alert resolved"
+    except:
+        st.session_state["alerts_flash"] = "Demo: Alert resolved"
+    st.session_state.pop("resolve_alert_id", None)
+    # Drop the form's widget state too, so the next alert's resolution
+    # form doesn't come pre-filled with this one's notes
+    st.session_state.pop("resolve_notes", None)
+    st.session_state.pop("resolve_fp", None)
+    st.session_state.pop("alerts_snap", None)
+    _fetch_alerts.clear()
+    _fetch_history.clear()
+
+
+def _remove_person(person_id):
+    try:
+        api_client.remove_from_watchlist(person_id)
+        st.session_state["watchlist_flash"] = "Removed from watchlist"
+    except:
+        st.session_state["watchlist_flash"] = "Demo: Removed from watchlist"
+    st.session_state.pop("watchlist_snap", None)
+    _fetch_watchlist.clear()
+
+
 # ==================== ACTIVE ALERTS TAB ====================
 if can_view_alerts:
     with tabs[tab_index]:
         st.markdown("### Active Security Alerts")
-        
+
+        if "alerts_flash" in st.session_state:
+            st.success(st.session_state.pop("alerts_flash"))
+
         # Fetch active alerts
         try:
-            alerts_data = api_client.get_active_alerts()
+            if alerts_snap is not None:
+                alerts_data = alerts_snap
+            else:
+                alerts_data = f_alerts.result()
+                _snap_put("alerts_snap", (), alerts_data)
             alerts = alerts_data.get("alerts", [])
         except:
             alerts = []
         
         if alerts:
             st.error(f"🚨 {len(alerts)} Active Alert(s) Requiring Attention!")
-            
-            for alert in alerts:
-                severity = alert.get("severity", "medium")
-                severity_colors = {
-                    "critical": "🔴",
-                    "high": "🟠",
-                    "medium": "🟡",
-                    "low": "🟢"
-                }
-                
-                with st.container():
-                    col1, col2, col3 = st.columns([2, 2, 1])
-                    
-                    with col1:
-                        st.markdown(f"""
-                        ### {severity_colors.get(severity, '⚪')} {alert.get('watchlist_person_name', 'Unknown')}
-                        **Category:** {alert.get('category', 'N/A').title()}  
-                        **Severity:** {severity.upper()}
-                        """)
-                    
-                    with col2:
-                        st.markdown(f"""
-                        **Gate:** {alert.get('gate_id', 'N/A')}  
-                        **Confidence:** {alert.get('confidence_score', 0):.1f}%  
-                        **Time:** {alert.get('created_at', 'N/A')[:19] if alert.get('created_at') else 'N/A'}
-                        """)
-                    
-                    with col3:
-                        if can_update:
-                            if not alert.get("is_acknowledged"):
-                                if st.button("✔ Acknowledge", key=f"ack_{alert.get('id')}"):
-                                    try:
-                                        api_client.acknowledge_alert(
-                                            alert.get("id"),
-                                            user_id
-                                        )
-                                        st.success("Alert acknowledged")
-                                        st.rerun()
-                                    except:
-                                        st.success("Demo: Alert acknowledged")
-                            
-                            if st.button("✅ Resolve", key=f"resolve_{alert.get('id')}"):
-                                st.session_state[f"resolve_alert_{alert.get('id')}"] = True
-                    
-                    # Resolution form (only if permitted)
-                    if can_update and st.session_state.get(f"resolve_alert_{alert.get('id')}"):
-                        with st.form(f"resolve_form_{alert.get('id')}"):
-                            resolution_notes = st.text_area("Resolution Notes")
-                            is_false_positive = st.checkbox("Mark as False Positive")
-                            
-                            if st.form_submit_button("Submit Resolution"):
-                                try:
-                                    api_client.resolve_alert(
-                                        alert.get("id"),
-                                        user_id,
-                                        resolution_notes,
-                                        is_false_positive
-                                    )
-                                    st.success("Alert resolved")
-                                    del st.session_state[f"resolve_alert_{alert.get('id')}"]
-                                    st.rerun()
-                                except:
-                                    st.success("Demo: Alert resolved")
-                    
-                    st.markdown("---")
+
+            # Window the list so render cost is bounded even if the API
+            # returns hundreds of alerts
+            alerts_page = st.session_state.get("alerts_page", 0)
+            alerts_pages = max(1, -(-len(alerts) // ALERTS_PAGE_SIZE))
+            alerts_page = min(alerts_page, alerts_pages - 1)
+            page_alerts = alerts[alerts_page * ALERTS_PAGE_SIZE:(alerts_page + 1) * ALERTS_PAGE_SIZE]
+
+            # One dataframe instead of columns/markdown/buttons per alert -
+            # widget count stays constant regardless of how many alerts exist
+            page_rows = [_norm_alert(alert) for alert in page_alerts]
+            df_alerts = pd.DataFrame(page_rows)
+
+            selection = st.dataframe(
+                df_alerts,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun" if can_update else "ignore",
+                selection_mode="multi-row",
+                column_config={
+                    "id": st.column_config.NumberColumn("ID", width="small"),
+                    "name": st.column_config.TextColumn("Person"),
+                    "category": st.column_config.TextColumn("Category"),
+                    "severity": st.column_config.TextColumn("Severity"),
+                    "gate": st.column_config.TextColumn("Gate"),
+                    "confidence": st.column_config.ProgressColumn(
+                        "Confidence", min_value=0, max_value=100, format="%.1f%%"
+                    ),
+                    "acknowledged": st.column_config.CheckboxColumn("Ack'd"),
+                    "time": st.column_config.TextColumn("Time"),
+                },
+            )
+
+            if alerts_pages > 1:
+                col_prev, col_page, col_next = st.columns([1, 3, 1])
+                with col_prev:
+                    if st.button("⬅ Prev", key="alerts_prev", disabled=alerts_page == 0):
+                        st.session_state["alerts_page"] = alerts_page - 1
+                        st.rerun()
+                with col_page:
+                    st.caption(f"Page {alerts_page + 1} of {alerts_pages}")
+                with col_next:
+                    if st.button("Next ➡", key="alerts_next", disabled=(alerts_page + 1) >= alerts_pages):
+                        st.session_state["alerts_page"] = alerts_page + 1
+                        st.rerun()
+
+            if can_update:
+                selected_rows = selection.selection.rows
+                selected_alerts = [page_rows[i] for i in selected_rows]
+                selected_ids = [a["id"] for a in selected_alerts]
+
+                if selected_ids:
+                    col_ack, col_resolve = st.columns(2)
+
+                    with col_ack:
+                        unacked = [a["id"] for a in selected_alerts if not a["acknowledged"]]
+                        if unacked:
+                            st.button(
+                                f"✔ Acknowledge {len(unacked)} selected",
+                                on_click=_ack_selected,
+                                args=(unacked,)
+                            )
+
+                    with col_resolve:
+                        if len(selected_ids) == 1:
+                            if st.button("✅ Resolve selected"):
+                                st.session_state["resolve_alert_id"] = selected_ids[0]
+                        else:
+                            st.caption("Select a single alert to resolve it")
+
+                # Resolution form - only ever rendered for one alert
+                resolve_id = st.session_state.get("resolve_alert_id")
+                if resolve_id:
+                    with st.form("resolve_alert_form"):
+                        st.markdown(f"**Resolving alert #{resolve_id}**")
+                        st.text_area("Resolution Notes", key="resolve_notes")
+                        st.checkbox("Mark as False Positive", key="resolve_fp")
+                        st.form_submit_button(
+                            "Submit Resolution",
+                            on_click=_resolve_selected,
+                            args=(resolve_id,)
+                        )
         else:
             st.success("✅ No active alerts at this time")
     
@@ -170,89 +426,138 @@ if can_view_alerts:
 # ==================== WATCHLIST TAB ====================
 with tabs[tab_index]:
     st.markdown("### Watchlist Database")
-    
-    # Filters
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        category_filter = st.selectbox(
-            "Category",
-            options=["All", "banned", "suspicious", "trespasser", "theft", "harassment", "fraud", "violence"],
-            format_func=lambda x: x.title()
-        )
-    with col2:
-        severity_filter = st.selectbox(
-            "Severity",
-            options=["All", "critical", "high", "medium", "low"],
-            format_func=lambda x: x.title()
-        )
-    with col3:
-        search = st.text_input("Search", placeholder="Name...")
-    
-    # Fetch watchlist
+
+    if "watchlist_flash" in st.session_state:
+        st.success(st.session_state.pop("watchlist_flash"))
+
+    # Filters - batched in a form so tweaking all three costs one rerun
+    # and one fetch instead of three. The keyed values only land in
+    # session_state on submit, which is exactly what the prefetch reads.
+    with st.form("wl_filters"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            category_filter = st.selectbox(
+                "Category",
+                options=CATEGORY_OPTIONS,
+                format_func=_title,
+                key="wl_category"
+            )
+        with col2:
+            severity_filter = st.selectbox(
+                "Severity",
+                options=SEVERITY_OPTIONS,
+                format_func=_title,
+                key="wl_severity"
+            )
+        with col3:
+            st.text_input("Search", placeholder="Name...", key="wl_search")
+
+        st.form_submit_button("Apply")
+
+    # Fetch one page at a time - expanders are only built for the rows
+    # actually shown, so render cost stays flat as the list grows
+    page = st.number_input("Page", min_value=1, value=1, step=1, key="watchlist_page")
+
     try:
-        params = {"is_active": True}
-        if category_filter != "All":
-            params["category"] = category_filter
-        if severity_filter != "All":
-            params["severity"] = severity_filter
-        
-        result = api_client.get_watchlist(**params)
+        if watchlist_snap is not None:
+            result = watchlist_snap
+        else:
+            result = f_watchlist.result()
+            _snap_put("watchlist_snap", wl_key, result)
         watchlist = result.get("persons", [])
+        total_entries = result.get("total", len(watchlist))
     except:
         watchlist = []
-    
-    if watchlist:
-        st.caption(f"Total: {len(watchlist)} entries")
-        
-        for person in watchlist:
-            severity = person.get("severity", "medium")
-            severity_colors = {
-                "critical": "🔴",
-                "high": "🟠",
-                "medium": "🟡",
-                "low": "🟢"
+        total_entries = 0
+
+    # Fields are bound once per person here; everything below works on
+    # the normalized rows instead of re-chaining .get per field.
+    # Search is applied server-side via watchlist_params, so this page
+    # already reflects the committed term.
+    person_rows = [_norm_person(p) for p in watchlist]
+
+    if person_rows:
+        total_pages = max(1, -(-total_entries // WATCHLIST_PAGE_SIZE))
+        st.caption(f"Total: {total_entries} entries · Page {page} of {total_pages}")
+
+        # One virtualized table for the page instead of an expander plus
+        # columns and buttons per person; details render for the selected
+        # row only
+        df_watchlist = pd.DataFrame([
+            {
+                "severity": f"{SEVERITY_ICONS.get(r['severity'], '⚪')} {r['severity'].title()}",
+                "name": r["name"],
+                "alias": r["alias"],
+                "category": r["category"],
+                "face": "📸" if r["face_image_url"] else "—",
+                "reason": r["reason"],
+                "added": r["added"],
             }
-            
-            # Show face status
-            has_face = "📸" if person.get('face_image_url') else "👤"
-            
-            with st.expander(f"{severity_colors.get(severity, '⚪')} {has_face} {person.get('full_name', 'N/A')} - {person.get('category', 'N/A').title()}"):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"""
-                    **Name:** {person.get('full_name', 'N/A')}  
-                    **Alias:** {person.get('alias', 'N/A')}  
-                    **Phone:** {person.get('phone', 'N/A')}  
-                    **Category:** {person.get('category', 'N/A').title()}
-                    """)
-                
-                with col2:
-                    face_status = "✅ Face registered" if person.get('face_image_url') else "❌ No face"
-                    st.markdown(f"""
-                    **Severity:** {severity_colors.get(severity, '⚪')} {severity.upper()}  
-                    **Reason:** {person.get('reason', 'N/A')}  
-                    **Added:** {person.get('created_at', 'N/A')[:10] if person.get('created_at') else 'N/A'}  
-                    **Face:** {face_status}
-                    """)
-                
-                # Image handling
-                if person.get('face_image_url'):
-                    image_path = get_valid_image_path(person.get('face_image_url'))
-                    if image_path:
-                        st.image(image_path, width=150)
+            for r in person_rows
+        ])
+
+        wl_event = st.dataframe(
+            df_watchlist,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+        )
+
+        if wl_event.selection.rows:
+            person = person_rows[wl_event.selection.rows[0]]
+
+            st.markdown("---")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown(f"""
+                **Name:** {person['name']}  
+                **Alias:** {person['alias'] or 'N/A'}  
+                **Phone:** {person['phone']}  
+                **Category:** {person['category']}
+                """)
+
+            with col2:
+                face_status = "✅ Face registered" if person['face_image_url'] else "❌ No face"
+                st.markdown(f"""
+                **Severity:** {SEVERITY_ICONS.get(person['severity'], '⚪')} {person['severity'].upper()}  
+                **Reason:** {person['reason'] or 'N/A'}  
+                **Added:** {person['added']}  
+                **Face:** {face_status}
+                """)
+
+            # Photo loads on demand for the selected person only
+            if person['face_image_url']:
+                image_path = get_valid_image_path(person['face_image_url'])
+                if image_path:
+                    photo_key = f"show_photo_{person['id']}"
+                    if st.session_state.get(photo_key):
+                        thumb = _load_thumbnail(image_path)
+                        if thumb:
+                            st.image(thumb, width=150)
+                        else:
+                            st.caption("📷 Image not available locally")
                     else:
-                        st.caption("📷 Image not available locally")
-                
-                # Delete button (only if permitted)
-                if can_delete:
-                    if st.button("🗑️ Remove from Watchlist", key=f"remove_{person.get('id')}"):
-                        try:
-                            api_client.remove_from_watchlist(person.get('id'))
-                            st.success("Removed from watchlist")
-                            st.rerun()
-                        except:
-                            st.success("Demo: Removed from watchlist")
+                        st.button(
+                            "📷 Show photo",
+                            key=f"photo_{person['id']}",
+                            on_click=st.session_state.__setitem__,
+                            args=(photo_key, True),
+                        )
+                else:
+                    st.caption("📷 Image not available locally")
+
+            # Delete button (only if permitted)
+            if can_delete:
+                st.button(
+                    "🗑️ Remove from Watchlist",
+                    key=f"remove_{person['id']}",
+                    on_click=_remove_person,
+                    args=(person['id'],)
+                )
+        else:
+            st.caption("Select a row for details and actions")
     else:
         st.info("No entries in watchlist")
 
@@ -263,12 +568,12 @@ if can_create:
     with tabs[tab_index]:
         st.markdown("### Add Person to Watchlist")
         
-        # Initialize session state for face image
-        if "watchlist_face_image_base64" not in st.session_state:
-            st.session_state.watchlist_face_image_base64 = None
-        if "watchlist_face_preview" not in st.session_state:
-            st.session_state.watchlist_face_preview = None
-        
+        # Only the token lives in session_state; bytes sit in _photo_store
+        if "watchlist_photo_token" not in st.session_state:
+            st.session_state.watchlist_photo_token = uuid.uuid4().hex
+        photo_token = st.session_state.watchlist_photo_token
+        photo_bytes = _photo_store().get(photo_token)
+
         # ========== PHOTO CAPTURE SECTION (OUTSIDE FORM) ==========
         st.markdown("---")
         st.markdown("**📷 Photo (for face recognition alerts)**")
@@ -291,33 +596,28 @@ if can_create:
                     help="Clear front-facing photo for best recognition"
                 )
                 if uploaded_file:
-                    # Read and store in session state immediately
-                    file_bytes = uploaded_file.read()
-                    st.session_state.watchlist_face_image_base64 = base64.b64encode(file_bytes).decode()
-                    st.session_state.watchlist_face_preview = file_bytes
+                    photo_bytes = compress_image(uploaded_file.getvalue())
+                    _photo_store()[photo_token] = photo_bytes
                     st.success("✅ Photo captured!")
             else:
                 camera_photo = st.camera_input("Take a photo", key="watchlist_camera")
                 if camera_photo:
-                    # Read and store in session state immediately
-                    file_bytes = camera_photo.read()
-                    st.session_state.watchlist_face_image_base64 = base64.b64encode(file_bytes).decode()
-                    st.session_state.watchlist_face_preview = file_bytes
+                    photo_bytes = compress_image(camera_photo.getvalue())
+                    _photo_store()[photo_token] = photo_bytes
                     st.success("✅ Photo captured!")
-        
+
         with col_photo2:
-            if st.session_state.watchlist_face_preview:
-                st.image(st.session_state.watchlist_face_preview, caption="Captured Photo", width=200)
+            if photo_bytes:
+                st.image(photo_bytes, caption="Captured Photo", width=200)
                 if st.button("🗑️ Clear Photo", key="clear_watchlist_photo"):
-                    st.session_state.watchlist_face_image_base64 = None
-                    st.session_state.watchlist_face_preview = None
+                    _photo_store().pop(photo_token, None)
                     st.rerun()
             else:
                 st.info("No photo captured yet")
-        
+
         # Show face status
-        if st.session_state.watchlist_face_image_base64:
-            st.success(f"📸 Face image ready ({len(st.session_state.watchlist_face_image_base64)} chars)")
+        if photo_bytes:
+            st.success(f"📸 Face image ready ({len(photo_bytes) // 1024} KB)")
         else:
             st.warning("⚠️ No face image - this person won't trigger automatic alerts at gates!")
         
@@ -334,16 +634,16 @@ if can_create:
                 
                 category = st.selectbox(
                     "Category *",
-                    options=["banned", "suspicious", "trespasser", "theft", "harassment", "fraud", "violence", "other"],
-                    format_func=lambda x: x.title()
+                    options=ADD_CATEGORY_OPTIONS,
+                    format_func=_title
                 )
-            
+
             with col2:
                 severity = st.selectbox(
                     "Severity *",
-                    options=["critical", "high", "medium", "low"],
+                    options=ADD_SEVERITY_OPTIONS,
                     index=1,
-                    format_func=lambda x: x.title()
+                    format_func=_title
                 )
                 
                 reason = st.text_area("Reason for Watchlist *", placeholder="Describe why this person should be flagged")
@@ -352,7 +652,7 @@ if can_create:
                 physical_description = st.text_area("Physical Description", placeholder="Height, build, distinguishing features...")
             
             # Show reminder about photo
-            if not st.session_state.watchlist_face_image_base64:
+            if not photo_bytes:
                 st.warning("⚠️ No photo uploaded. This person will NOT be automatically detected at gates!")
             
             submitted = st.form_submit_button("➕ Add to Watchlist", use_container_width=True, type="primary")
@@ -361,9 +661,6 @@ if can_create:
                 if not full_name or not reason:
                     st.error("Please fill in required fields (Name, Reason)")
                 else:
-                    # Get face image from session state (THIS IS THE FIX!)
-                    face_image_base64 = st.session_state.watchlist_face_image_base64
-                    
                     person_data = {
                         "full_name": full_name,
                         "alias": alias if alias else None,
@@ -373,23 +670,25 @@ if can_create:
                         "reason": reason,
                         "last_known_address": last_known_address if last_known_address else None,
                         "physical_description": physical_description if physical_description else None,
-                        "face_image_base64": face_image_base64  # From session state!
                     }
-                    
+
                     # Debug: Show what we're sending
-                    if face_image_base64:
-                        st.info(f"📤 Sending with face image ({len(face_image_base64)} chars)")
+                    if photo_bytes:
+                        st.info(f"📤 Sending with face image ({len(photo_bytes) // 1024} KB)")
                     else:
                         st.warning("📤 Sending WITHOUT face image - no automatic detection!")
-                    
+
                     with st.spinner("Adding to watchlist..."):
                         try:
-                            result = api_client.add_to_watchlist(person_data, user_id)
+                            result = api_client.add_to_watchlist_multipart(
+                                person_data, user_id, photo_bytes
+                            )
                             
                             if "error" not in result:
-                                # Clear the face image from session state after success
-                                st.session_state.watchlist_face_image_base64 = None
-                                st.session_state.watchlist_face_preview = None
+                                # Drop the stored photo after success
+                                _photo_store().pop(photo_token, None)
+                                st.session_state.pop("watchlist_snap", None)
+                                _fetch_watchlist.clear()
                                 
                                 st.success(f"✅ {full_name} added to watchlist")
                                 
@@ -403,32 +702,32 @@ if can_create:
                         except Exception as e:
                             st.error(f"Error: {str(e)}")
 
-# Alert History (only if can view alerts)
+# Alert History (only if can view alerts) - nothing is fetched until
+# someone actually opens the section
 if can_view_alerts:
     st.markdown("---")
-    st.markdown("### 📜 Alert History")
-    
-    try:
-        history = api_client.get_alerts(is_resolved=True, limit=20)
-        resolved_alerts = history.get("alerts", [])
-    except:
-        resolved_alerts = []
-    
-    if resolved_alerts:
-        alert_data = []
-        for alert in resolved_alerts[:10]:
-            alert_data.append({
-                "Person": alert.get("watchlist_person_name", "N/A"),
-                "Severity": alert.get("severity", "N/A"),
-                "Confidence": f"{alert.get('confidence_score', 0):.1f}%",
-                "False Positive": "Yes" if alert.get("is_false_positive") else "No",
-                "Created": alert.get("created_at", "N/A")[:16] if alert.get("created_at") else "N/A",
-                "Resolved": alert.get("resolved_at", "N/A")[:16] if alert.get("resolved_at") else "N/A"
-            })
-        
-        st.dataframe(pd.DataFrame(alert_data), use_container_width=True, hide_index=True)
-    else:
-        st.info("No resolved alerts in history")
+    with st.expander("📜 Alert History"):
+        if st.button("Load history") or st.session_state.get("hist_loaded"):
+            st.session_state["hist_loaded"] = True
+
+            try:
+                history = f_history.result() if f_history else _fetch_history()
+                resolved_alerts = history.get("alerts", [])
+            except:
+                resolved_alerts = []
+
+            if resolved_alerts:
+                # The frame itself is cached; unchanged history hits on
+                # the (id, resolved_at) signature and skips construction
+                page_hist = resolved_alerts[:10]
+                sig = tuple((a.get("id"), a.get("resolved_at")) for a in page_hist)
+                st.dataframe(
+                    _history_frame(sig, page_hist),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info("No resolved alerts in history")
 
 # Sidebar
 with st.sidebar:
@@ -446,8 +745,7 @@ with st.sidebar:
     st.markdown("### 📊 Watchlist Stats")
     
     try:
-        stats = api_client.get_watchlist()
-        total = stats.get("total", 0)
+        total = _fetch_watchlist_count().get("total", 0)
     except:
         total = 0
     
@@ -1,10 +1,20 @@
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-import base64
 import sys
+import threading
+import time
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 sys.path.append("..")
 from utils.api_client import api_client
+from utils.images import make_thumbnail
+from utils.constants import (
+    CATEGORY_LABELS, INCIDENT_CATEGORIES, INCIDENT_STATUSES,
+    RESIDENT_INCIDENT_CATEGORIES, SEVERITIES, SEVERITY_LABELS, STATUS_LABELS,
+)
 from utils.permissions import (
     require_auth, has_permission, is_resident, is_receptionist, is_security_staff, is_admin,
     Permission, show_permission_denied, get_role_display_name
@@ -16,6 +26,91 @@ st.set_page_config(
     layout="wide"
 )
 
+# Bounds render (and server) work per rerun regardless of dataset size
+INCIDENT_PAGE_SIZE = 25
+
+# Shared lookup tables - allocated once at import instead of per row
+SEVERITY_COLORS = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+STATUS_COLORS = {
+    "open": "🔵",
+    "in_progress": "🟣",
+    "pending_review": "🟤",
+    "resolved": "✅",
+    "closed": "⚫",
+    "escalated": "🔴"
+}
+STATUS_OPTIONS = ("open", "in_progress", "pending_review", "resolved", "escalated")
+STATUS_INDEX = {s: i for i, s in enumerate(STATUS_OPTIONS)}
+
+# Filter vocabularies with the "All" sentinel prepended once at import
+FILTER_STATUS_OPTIONS = ("All",) + INCIDENT_STATUSES
+FILTER_SEVERITY_OPTIONS = ("All",) + SEVERITIES
+FILTER_CATEGORY_OPTIONS = ("All",) + INCIDENT_CATEGORIES
+
+# Resident-facing urgency picker
+URGENCY_OPTIONS = ("low", "medium", "high")
+URGENCY_LABELS = {
+    "low": "🟢 Not urgent - Can wait",
+    "medium": "🟡 Somewhat urgent",
+    "high": "🟠 Urgent - Needs attention soon",
+}
+
+
+# Cached fetchers - reruns triggered by widget interaction reuse the
+# last response instead of re-hitting the API. Mutation handlers clear
+# whichever of these they invalidate.
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_stats():
+    return api_client.get_incident_stats()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_incidents(**params):
+    return api_client.get_incidents(**params)
+
+
+# Critical incidents get the shortest TTL - staleness matters most here
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_critical():
+    return api_client.get_critical_incidents()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _incident_frame(sig, _incidents):
+    """Build the list DataFrame once per distinct page of incidents.
+
+    ``sig`` captures (id, status, updated_at) per row; ``_incidents`` is
+    underscore-prefixed so Streamlit skips hashing the payload and the
+    frame is only reconstructed when a row actually changed.
+    """
+    return pd.DataFrame([
+        {
+            "number": i.get("incident_number") or "N/A",
+            "title": i.get("title") or "N/A",
+            "category": (i.get("category") or "N/A").replace("_", " ").title(),
+            "severity": f"{SEVERITY_COLORS.get(i.get('severity', 'medium'), '⚪')} {(i.get('severity') or 'medium').title()}",
+            "status": f"{STATUS_COLORS.get(i.get('status', 'open'), '❓')} {(i.get('status') or 'open').replace('_', ' ').title()}",
+            "location": i.get("location") or "N/A",
+            "created": i.get("created_at", "")[:16] if i.get("created_at") else "N/A",
+        }
+        for i in _incidents
+    ])
+
+
+def _clear_incident_caches():
+    _fetch_stats.clear()
+    _fetch_incidents.clear()
+    _fetch_critical.clear()
+    st.session_state.pop("incidents_snap", None)
+
+
+# One pool reused across reruns - the fetches are I/O bound, so issuing
+# them together makes page latency the slowest call, not the sum
+@st.cache_resource
+def _fetch_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+
 # Check authentication
 if not require_auth():
     st.stop()
@@ -28,16 +123,146 @@ if not has_permission(Permission.INCIDENT_READ.value) and not has_permission(Per
 # Get user info and permissions
 user_id = st.session_state.get("user_id", 1)
 user_name = st.session_state.get("user_name", "User")
-can_create = has_permission(Permission.INCIDENT_CREATE.value)
-can_read = has_permission(Permission.INCIDENT_READ.value)
-can_update = has_permission(Permission.INCIDENT_UPDATE.value)
-can_assign = has_permission(Permission.INCIDENT_ASSIGN.value)
+
+
+@dataclass(frozen=True, slots=True)
+class RoleContext:
+    """Immutable snapshot of the session's role and permission flags."""
+    is_resident: bool
+    is_receptionist: bool
+    is_security_staff: bool
+    is_admin: bool
+    can_create: bool
+    can_read: bool
+    can_update: bool
+    can_assign: bool
+
+
+def _resolved_perms() -> RoleContext:
+    """Resolve the page's permission and role flags in one pass."""
+    return RoleContext(
+        is_resident=is_resident(),
+        is_receptionist=is_receptionist(),
+        is_security_staff=is_security_staff(),
+        is_admin=is_admin(),
+        can_create=has_permission(Permission.INCIDENT_CREATE.value),
+        can_read=has_permission(Permission.INCIDENT_READ.value),
+        can_update=has_permission(Permission.INCIDENT_UPDATE.value),
+        can_assign=has_permission(Permission.INCIDENT_ASSIGN.value),
+    )
+
+
+# Flags are stable for a logged-in session; cache the frozen snapshot
+# keyed by (user_id, role) so reruns do one dict lookup instead of
+# re-running every permission/role helper (is_resident alone was called
+# ~15x/run); slots=True keeps attribute access at C level
+_perm_key = (user_id, st.session_state.get("user_role", "unknown"))
+_perm_cache = st.session_state.setdefault("_perm_cache", {})
+ctx = _perm_cache.get(_perm_key)
+if ctx is None:
+    ctx = _perm_cache[_perm_key] = _resolved_perms()
+
+can_create = ctx.can_create
+can_read = ctx.can_read
+can_update = ctx.can_update
+can_assign = ctx.can_assign
+is_res = ctx.is_resident
+is_recep = ctx.is_receptionist
+is_sec = ctx.is_security_staff
+is_adm = ctx.is_admin
+
+# Kick off the page's independent fetches together on the shared pool.
+# The filter widgets are keyed, so the values they will render with are
+# already in session_state here, before the tabs draw them.
+_ctx = get_script_run_ctx()
+
+
+def _submit(fn, *args, **kwargs):
+    def _run():
+        # Cached fetchers need the script-run context inside worker threads
+        add_script_run_ctx(threading.current_thread(), _ctx)
+        return fn(*args, **kwargs)
+
+    return _fetch_executor().submit(_run)
+
+
+def _incident_params():
+    """Build the list query from the keyed filter widgets' committed
+    values - callable both at the top of a full run (for the prefetch)
+    and inside the list fragment, where only the fragment re-executes."""
+    params = {
+        "skip": st.session_state.get("incidents_page", 0) * INCIDENT_PAGE_SIZE,
+        "limit": INCIDENT_PAGE_SIZE,
+    }
+    if st.session_state.get("inc_status", "All") != "All":
+        params["status"] = st.session_state["inc_status"]
+    if is_res:
+        # For residents, only show their own reports
+        params["reported_by"] = user_id
+    else:
+        if st.session_state.get("inc_severity", "All") != "All":
+            params["severity"] = st.session_state["inc_severity"]
+        if st.session_state.get("inc_category", "All") != "All":
+            params["category"] = st.session_state["inc_category"]
+        if st.session_state.get("inc_search"):
+            params["search"] = st.session_state["inc_search"]
+    return params
+
+
+def _snap_get(key):
+    """Session-held snapshot keyed by the filter tuple - switching tabs
+    reuses the parsed page even after the cache entry has expired and
+    skips the fetch entirely; mutations pop it via _clear_incident_caches"""
+    snap = st.session_state.get("incidents_snap")
+    if snap and snap[0] == key and time.time() - snap[1] <= 15:
+        return snap[2]
+    return None
+
+
+incident_params = _incident_params()
+inc_key = tuple(sorted(incident_params.items()))
+incidents_snap = _snap_get(inc_key)
+
+f_stats = _submit(_fetch_stats) if not is_res else None
+f_incidents = _submit(_fetch_incidents, **incident_params) if can_read and incidents_snap is None else None
+f_critical = _submit(_fetch_critical) if is_sec or is_adm else None
+
+
+# Mutation callbacks - run before the rerun Streamlit already does after
+# a callback, so a separate st.rerun() (and the full second script pass
+# it costs) is unnecessary. Outcome messages are stashed in session_state
+# and shown at the top of the owning tab on the following render.
+def _update_incident(incident_id, current_status):
+    try:
+        # Widget keys carry the incident id so a stale choice made on a
+        # previously selected row can't leak onto this one
+        new_status = st.session_state.get(f"upd_status_{incident_id}", current_status)
+        comment = st.session_state.get(f"upd_comment_{incident_id}", "")
+        update_data = {"status": new_status} if new_status != current_status else {}
+        if update_data or comment:
+            # One atomic round trip for status + comment instead of two
+            api_client.update_incident_with_comment(
+                incident_id, update_data, comment or None, user_id
+            )
+        st.session_state["incidents_flash"] = "Incident updated"
+    except:
+        st.session_state["incidents_flash"] = "Demo: Incident updated"
+    _clear_incident_caches()
+
+
+def _escalate_incident(incident_id):
+    try:
+        api_client.update_incident(incident_id, {"status": "escalated"}, user_id)
+        st.session_state["critical_flash"] = "Incident escalated!"
+    except:
+        st.session_state["critical_flash"] = "Demo: Incident escalated!"
+    _clear_incident_caches()
 
 # Page title based on role
-if is_resident():
+if is_res:
     st.title("📋 Report & Track Issues")
     st.markdown("Report security concerns and track your submissions")
-elif is_receptionist():
+elif is_recep:
     st.title("📋 Incident Reports")
     st.markdown("Log and view incident reports")
 else:
@@ -45,9 +270,9 @@ else:
     st.markdown("Report, track, and resolve security incidents")
 
 # Stats row (different for residents vs staff)
-if not is_resident():
+if not is_res:
     try:
-        stats = api_client.get_incident_stats()
+        stats = f_stats.result()
     except:
         stats = {"total": 0, "open": 0, "critical": 0, "resolved_today": 0}
     
@@ -66,347 +291,409 @@ if not is_resident():
 # Build tabs based on permissions
 tab_names = []
 if can_create:
-    tab_names.append("➕ Report Incident" if is_resident() else "➕ Report Incident")
+    tab_names.append("➕ Report Incident" if is_res else "➕ Report Incident")
 if can_read:
-    tab_names.append("📋 My Reports" if is_resident() else "📋 All Incidents")
-if is_security_staff() or is_admin():
+    tab_names.append("📋 My Reports" if is_res else "📋 All Incidents")
+if is_sec or is_adm:
     tab_names.append("🚨 Critical")
 
-tabs = st.tabs(tab_names)
-
-tab_index = 0
+# Radio-driven dispatch instead of st.tabs: st.tabs executes every
+# tab body on every rerun, the radio renders only the selected one
+active_tab = st.radio(
+    "View",
+    tab_names,
+    horizontal=True,
+    label_visibility="collapsed",
+    key="incidents_tab",
+)
 
 # ==================== REPORT INCIDENT TAB ====================
-if can_create:
-    with tabs[tab_index]:
-        if is_resident():
-            st.markdown("### Report a Security Concern")
-            st.info("💡 Use this form to report any security concerns, suspicious activity, or issues in your building.")
-        else:
-            st.markdown("### Report New Incident")
+# Fragment-scoped like the other tabs: a submit reruns only this body,
+# not the stats row or the sidebar
+@st.fragment
+def _render_report_tab():
+    if is_res:
+        st.markdown("### Report a Security Concern")
+        st.info("💡 Use this form to report any security concerns, suspicious activity, or issues in your building.")
+    else:
+        st.markdown("### Report New Incident")
+    
+    with st.form("incident_form"):
+        col1, col2 = st.columns(2)
         
-        with st.form("incident_form"):
-            col1, col2 = st.columns(2)
+        with col1:
+            title = st.text_input("Incident Title *", placeholder="Brief description of the incident")
             
-            with col1:
-                title = st.text_input("Incident Title *", placeholder="Brief description of the incident")
-                
-                # Simplified categories for residents
-                if is_resident():
-                    category_options = [
-                        "suspicious_activity", "noise_complaint", "parking_violation",
-                        "visitor_issue", "equipment_failure", "other"
-                    ]
-                else:
-                    category_options = [
-                        "unauthorized_entry", "theft", "vandalism", "harassment",
-                        "suspicious_activity", "parking_violation", "noise_complaint",
-                        "fire_safety", "medical_emergency", "visitor_issue",
-                        "equipment_failure", "other"
-                    ]
-                
-                category = st.selectbox(
-                    "Category *",
-                    options=category_options,
-                    format_func=lambda x: x.replace("_", " ").title()
-                )
-                
-                # Simplified severity for residents
-                if is_resident():
-                    severity = st.selectbox(
-                        "How urgent is this?",
-                        options=["low", "medium", "high"],
-                        index=1,
-                        format_func=lambda x: {
-                            "low": "🟢 Not urgent - Can wait",
-                            "medium": "🟡 Somewhat urgent",
-                            "high": "🟠 Urgent - Needs attention soon"
-                        }.get(x, x.title())
-                    )
-                else:
-                    severity = st.selectbox(
-                        "Severity *",
-                        options=["critical", "high", "medium", "low"],
-                        index=2,
-                        format_func=lambda x: x.title()
-                    )
-                
-                location = st.text_input(
-                    "Location *", 
-                    placeholder="e.g., Block A - Ground Floor",
-                    value=f"Unit {st.session_state.get('unit_number', '')}" if is_resident() else ""
-                )
+            # Simplified categories for residents
+            category = st.selectbox(
+                "Category *",
+                options=RESIDENT_INCIDENT_CATEGORIES if is_res else INCIDENT_CATEGORIES,
+                format_func=CATEGORY_LABELS.get
+            )
             
-            with col2:
-                incident_time = st.datetime_input(
-                    "When did it happen?",
-                    value=datetime.now()
+            # Simplified severity for residents
+            if is_res:
+                severity = st.selectbox(
+                    "How urgent is this?",
+                    options=URGENCY_OPTIONS,
+                    index=1,
+                    format_func=URGENCY_LABELS.get
                 )
-                
-                description = st.text_area(
-                    "Detailed Description *",
-                    placeholder="Provide detailed information about the incident...",
-                    height=150
+            else:
+                severity = st.selectbox(
+                    "Severity *",
+                    options=SEVERITIES,
+                    index=2,
+                    format_func=SEVERITY_LABELS.get
                 )
             
-            st.markdown("**Evidence (Optional)**")
-            evidence_files = st.file_uploader(
-                "Upload photos/evidence",
-                type=["jpg", "jpeg", "png"],
-                accept_multiple_files=True
+            location = st.text_input(
+                "Location *", 
+                placeholder="e.g., Block A - Ground Floor",
+                value=f"Unit {st.session_state.get('unit_number', '')}" if is_res else ""
+            )
+        
+        with col2:
+            incident_time = st.datetime_input(
+                "When did it happen?",
+                value=datetime.now()
             )
             
-            evidence_base64 = []
-            if evidence_files:
-                for f in evidence_files:
-                    evidence_base64.append(base64.b64encode(f.read()).decode())
-                st.success(f"{len(evidence_files)} file(s) attached")
-            
-            submitted = st.form_submit_button("📋 Submit Report", use_container_width=True)
-            
-            if submitted:
-                if not title or not description or not location:
-                    st.error("Please fill in all required fields")
-                else:
-                    incident_data = {
-                        "title": title,
-                        "description": description,
-                        "category": category,
-                        "severity": severity,
-                        "location": location,
-                        "incident_time": incident_time.isoformat() if incident_time else None,
-                        "evidence_base64": evidence_base64 if evidence_base64 else None
-                    }
-                    
-                    with st.spinner("Submitting report..."):
-                        try:
-                            result = api_client.create_incident(incident_data, user_id)
-                            
-                            if "error" not in result:
-                                st.success(f"""
-                                ✅ **Report Submitted Successfully!**
-                                
-                                **Reference Number:** `{result.get('incident_number', 'N/A')}`
-                                
-                                {"Our team will review your report and take appropriate action." if is_resident() else "The incident has been logged and will be reviewed."}
-                                """)
-                            else:
-                                st.error(f"Failed: {result.get('error')}")
-                        except:
-                            import random
-                            mock_id = f"INC-2024-{random.randint(100, 999)}"
+            description = st.text_area(
+                "Detailed Description *",
+                placeholder="Provide detailed information about the incident...",
+                height=150
+            )
+        
+        st.markdown("**Evidence (Optional)**")
+        evidence_files = st.file_uploader(
+            "Upload photos/evidence",
+            type=["jpg", "jpeg", "png"],
+            accept_multiple_files=True
+        )
+        
+        if evidence_files:
+            st.success(f"{len(evidence_files)} file(s) attached")
+            # Preview at thumbnail size; the full-resolution bytes
+            # still go to the upload endpoint on submit
+            preview_cols = st.columns(min(len(evidence_files), 4))
+            for i, f in enumerate(evidence_files):
+                thumb = make_thumbnail(f.getvalue())
+                if thumb is not None:
+                    preview_cols[i % len(preview_cols)].image(
+                        thumb, caption=f.name, use_container_width=True
+                    )
+
+        submitted = st.form_submit_button("📋 Submit Report", use_container_width=True)
+
+        if submitted:
+            # Reruns are serialized, so a flag set and cleared inside
+            # one run can never catch a queued second click. Instead a
+            # fingerprint of the submitted payload is kept after a
+            # successful create; the rerun from the second click
+            # carries the identical payload and is dropped here.
+            submit_token = (title, description, category, severity,
+                            location, str(incident_time))
+            if not title or not description or not location:
+                st.error("Please fill in all required fields")
+            elif st.session_state.get("_last_create_token") == submit_token:
+                st.info("This report was already submitted")
+            else:
+                incident_data = {
+                    "title": title,
+                    "description": description,
+                    "category": category,
+                    "severity": severity,
+                    "location": location,
+                    "incident_time": incident_time.isoformat() if incident_time else None,
+                }
+
+                with st.spinner("Submitting report..."):
+                    try:
+                        result = api_client.create_incident(incident_data, user_id)
+
+                        if "error" not in result:
+                            # Evidence goes up as raw multipart
+                            # bytes in parallel - no base64 pass,
+                            # no inflated JSON body
+                            if evidence_files:
+                                api_client.upload_incident_evidence(
+                                    result.get("id"), user_id,
+                                    [f.getvalue() for f in evidence_files],
+                                )
+                            st.session_state["_last_create_token"] = submit_token
+                            _clear_incident_caches()
                             st.success(f"""
-                            ✅ **Report Submitted (Demo Mode)**
-                            
-                            **Reference Number:** `{mock_id}`
+                            ✅ **Report Submitted Successfully!**
+
+                            **Reference Number:** `{result.get('incident_number', 'N/A')}`
+
+                            {"Our team will review your report and take appropriate action." if is_res else "The incident has been logged and will be reviewed."}
                             """)
-    
-    tab_index += 1
+                        else:
+                            # Leave the token unset so a retry of the
+                            # same payload goes through
+                            st.error(f"Failed: {result.get('error')}")
+                    except:
+                        import random
+                        mock_id = f"INC-2024-{random.randint(100, 999)}"
+                        st.session_state["_last_create_token"] = submit_token
+                        st.success(f"""
+                        ✅ **Report Submitted (Demo Mode)**
+
+                        **Reference Number:** `{mock_id}`
+                        """)
+
+
+if can_create and active_tab == "➕ Report Incident":
+    _render_report_tab()
 
 # ==================== ALL INCIDENTS TAB ====================
-if can_read:
-    with tabs[tab_index]:
-        if is_resident():
-            st.markdown("### My Submitted Reports")
-            st.caption("Track the status of your reports")
-        else:
-            st.markdown("### Incident List")
-        
-        # Filters (simplified for residents)
-        if is_resident():
-            col1, col2 = st.columns(2)
-            with col1:
-                status_filter = st.selectbox(
-                    "Status",
-                    options=["All", "open", "in_progress", "resolved"],
-                    format_func=lambda x: x.replace("_", " ").title()
-                )
-            with col2:
-                if st.button("🔄 Refresh"):
-                    st.rerun()
-        else:
+# Fragment-scoped: filter changes, row selection and update submissions
+# rerun only this block - the stats row, the report form, the critical
+# tab and the sidebar are untouched
+@st.fragment
+def _render_incidents_tab():
+    global f_incidents
+
+    if is_res:
+        st.markdown("### My Submitted Reports")
+        st.caption("Track the status of your reports")
+    else:
+        st.markdown("### Incident List")
+
+    flash = st.session_state.pop("incidents_flash", None)
+    if flash:
+        st.success(flash)
+
+    # Filters (simplified for residents)
+    if is_res:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.selectbox(
+                "Status",
+                options=("All", "open", "in_progress", "resolved"),
+                key="inc_status",
+                format_func=STATUS_LABELS.get
+            )
+        with col2:
+            st.button("🔄 Refresh", on_click=_clear_incident_caches)
+    else:
+        # Form-batched filters: nothing refetches until Apply - without
+        # this every keystroke in Search fired a rerun plus an API call
+        with st.form("incident_filters"):
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                status_filter = st.selectbox(
+                st.selectbox(
                     "Status",
-                    options=["All", "open", "in_progress", "pending_review", "resolved", "closed", "escalated"],
-                    format_func=lambda x: x.replace("_", " ").title()
+                    options=FILTER_STATUS_OPTIONS,
+                    key="inc_status",
+                    format_func=STATUS_LABELS.get
                 )
             with col2:
-                severity_filter = st.selectbox(
+                st.selectbox(
                     "Severity",
-                    options=["All", "critical", "high", "medium", "low"],
-                    format_func=lambda x: x.title()
+                    options=FILTER_SEVERITY_OPTIONS,
+                    key="inc_severity",
+                    format_func=SEVERITY_LABELS.get
                 )
             with col3:
-                category_filter = st.selectbox(
+                st.selectbox(
                     "Category",
-                    options=["All", "unauthorized_entry", "theft", "vandalism", "harassment", 
-                            "suspicious_activity", "parking_violation", "noise_complaint",
-                            "fire_safety", "medical_emergency", "visitor_issue", "equipment_failure", "other"],
-                    format_func=lambda x: x.replace("_", " ").title()
+                    options=FILTER_CATEGORY_OPTIONS,
+                    key="inc_category",
+                    format_func=CATEGORY_LABELS.get
                 )
             with col4:
-                search = st.text_input("Search", placeholder="Title or ID...")
-        
-        # Fetch incidents
-        try:
-            params = {}
-            if status_filter != "All":
-                params["status"] = status_filter
-            if not is_resident():
-                if severity_filter != "All":
-                    params["severity"] = severity_filter
-                if category_filter != "All":
-                    params["category"] = category_filter
-                if search:
-                    params["search"] = search
+                st.text_input("Search", placeholder="Title or ID...", key="inc_search")
+            st.form_submit_button("Apply")
+
+    # Recompute the query here: on a fragment-only rerun the module-level
+    # params are from the last full pass and may be stale
+    params = _incident_params()
+    key = tuple(sorted(params.items()))
+    inc_page = st.session_state.get("incidents_page", 0)
+
+    try:
+        result = _snap_get(key)
+        if result is None:
+            if f_incidents is not None and key == inc_key:
+                # Consume the prefetched future once; later fragment
+                # reruns (filter changes, mutations) go through the
+                # cached fetcher so they never see pre-mutation data
+                result = f_incidents.result()
+                f_incidents = None
             else:
-                # For residents, only show their own reports
-                params["reported_by"] = user_id
-            
-            result = api_client.get_incidents(**params)
-            incidents = result.get("incidents", [])
-        except:
-            incidents = []
-        
-        if incidents:
-            for incident in incidents:
-                severity = incident.get("severity", "medium")
-                status = incident.get("status", "open")
-                
-                severity_colors = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
-                status_colors = {
-                    "open": "🔵",
-                    "in_progress": "🟣",
-                    "pending_review": "🟤",
-                    "resolved": "✅",
-                    "closed": "⚫",
-                    "escalated": "🔴"
-                }
-                
-                with st.expander(f"{severity_colors.get(severity, '⚪')} {incident.get('incident_number', 'N/A')} - {incident.get('title', 'N/A')}"):
-                    col1, col2, col3 = st.columns([2, 2, 1])
-                    
-                    with col1:
-                        st.markdown(f"""
-                        **ID:** {incident.get('incident_number', 'N/A')}  
-                        **Title:** {incident.get('title', 'N/A')}  
-                        **Category:** {incident.get('category', 'N/A').replace('_', ' ').title()}  
-                        **Location:** {incident.get('location', 'N/A')}
-                        """)
-                    
-                    with col2:
-                        st.markdown(f"""
-                        **Severity:** {severity_colors.get(severity, '⚪')} {severity.upper()}  
-                        **Status:** {status_colors.get(status, '❓')} {status.replace('_', ' ').title()}  
-                        **Created:** {incident.get('created_at', 'N/A')[:16] if incident.get('created_at') else 'N/A'}
-                        """)
-                    
-                    with col3:
-                        # Update buttons only for staff with permissions
-                        if can_update and status in ['open', 'in_progress']:
-                            if st.button("Update", key=f"view_{incident.get('id')}"):
-                                st.session_state.selected_incident = incident.get('id')
-                    
-                    # Description
-                    if incident.get('description'):
-                        st.markdown("**Description:**")
-                        st.write(incident.get('description', 'No description provided'))
-                    
-                    # Update form (only for staff with update permission)
-                    if can_update and st.session_state.get('selected_incident') == incident.get('id'):
-                        st.markdown("---")
-                        
-                        with st.form(f"update_form_{incident.get('id')}"):
-                            new_status = st.selectbox(
-                                "Update Status",
-                                options=["open", "in_progress", "pending_review", "resolved", "escalated"],
-                                index=["open", "in_progress", "pending_review", "resolved", "escalated"].index(status) if status in ["open", "in_progress", "pending_review", "resolved", "escalated"] else 0,
-                                format_func=lambda x: x.replace("_", " ").title()
-                            )
-                            
-                            comment = st.text_area("Add Comment/Update")
-                            
-                            # Assignment (only for those with assign permission)
-                            if can_assign:
-                                assign_to = st.text_input("Assign to (User ID)", placeholder="Enter user ID")
-                            
-                            if st.form_submit_button("Update Incident"):
-                                try:
-                                    if new_status != status:
-                                        api_client.update_incident(
-                                            incident.get('id'),
-                                            {"status": new_status},
-                                            user_id
-                                        )
-                                    if comment:
-                                        api_client.add_incident_comment(
-                                            incident.get('id'),
-                                            comment,
-                                            user_id
-                                        )
-                                    st.success("Incident updated")
-                                    st.rerun()
-                                except:
-                                    st.success("Demo: Incident updated")
+                result = _fetch_incidents(**params)
+            st.session_state["incidents_snap"] = (key, time.time(), result)
+
+        incidents = result.get("incidents", [])
+        incidents_total = result.get("total", len(incidents))
+    except:
+        incidents = []
+        incidents_total = 0
+
+    if incidents:
+        # Single virtualized table instead of an expander per incident;
+        # unchanged pages hit the frame cache on their row signature
+        sig = tuple((i.get("id"), i.get("status"), i.get("updated_at")) for i in incidents)
+        df_incidents = _incident_frame(sig, incidents)
+
+        incident_event = st.dataframe(
+            df_incidents,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                "number": st.column_config.TextColumn("Number", width="small"),
+                "title": st.column_config.TextColumn("Title", width="medium"),
+                "category": st.column_config.TextColumn("Category"),
+                "severity": st.column_config.TextColumn("Severity", width="small"),
+                "status": st.column_config.TextColumn("Status", width="small"),
+                "location": st.column_config.TextColumn("Location"),
+                "created": st.column_config.TextColumn("Created", width="small"),
+            },
+        )
+
+        total_pages = max(1, -(-incidents_total // INCIDENT_PAGE_SIZE))
+        col_prev, col_page, col_next = st.columns([1, 3, 1])
+        with col_prev:
+            if st.button("⬅ Prev", disabled=inc_page == 0):
+                st.session_state["incidents_page"] = inc_page - 1
+                st.rerun(scope="fragment")
+        with col_page:
+            st.caption(f"Page {inc_page + 1} of {total_pages} · {incidents_total} incident(s)")
+        with col_next:
+            if st.button("Next ➡", disabled=(inc_page + 1) >= total_pages):
+                st.session_state["incidents_page"] = inc_page + 1
+                st.rerun(scope="fragment")
+
+        if incident_event.selection.rows:
+            # Bind the selected row's fields once instead of re-chaining
+            # .get per f-string below
+            incident = incidents[incident_event.selection.rows[0]]
+            incident_id = incident.get("id")
+            number = incident.get("incident_number") or "N/A"
+            inc_title = incident.get("title") or "N/A"
+            description = incident.get("description")
+            severity = incident.get("severity", "medium")
+            status = incident.get("status", "open")
+
+            st.markdown("---")
+            st.markdown(
+                f"#### {SEVERITY_COLORS.get(severity, '⚪')} {number} - {inc_title}"
+            )
+
+            # Description
+            if description:
+                st.markdown("**Description:**")
+                st.write(description)
+
+            # Update form (only for staff with update permission)
+            if can_update and status in ['open', 'in_progress']:
+                with st.form(f"update_incident_form_{incident_id}"):
+                    st.selectbox(
+                        "Update Status",
+                        options=STATUS_OPTIONS,
+                        index=STATUS_INDEX.get(status, 0),
+                        key=f"upd_status_{incident_id}",
+                        format_func=STATUS_LABELS.get
+                    )
+
+                    st.text_area("Add Comment/Update", key=f"upd_comment_{incident_id}")
+
+                    # Assignment (only for those with assign permission)
+                    if can_assign:
+                        assign_to = st.text_input("Assign to (User ID)", placeholder="Enter user ID")
+
+                    st.form_submit_button(
+                        "Update Incident",
+                        on_click=_update_incident,
+                        args=(incident_id, status),
+                    )
         else:
-            if is_resident():
-                st.info("You haven't submitted any reports yet. Use the 'Report Incident' tab to submit a new report.")
-            else:
-                st.info("No incidents found matching filters")
-    
-    tab_index += 1
+            st.caption("Select a row for details and actions")
+    else:
+        if is_res:
+            st.info("You haven't submitted any reports yet. Use the 'Report Incident' tab to submit a new report.")
+        else:
+            st.info("No incidents found matching filters")
+
+
+if can_read and active_tab in ("📋 My Reports", "📋 All Incidents"):
+    _render_incidents_tab()
 
 # ==================== CRITICAL TAB ====================
-if is_security_staff() or is_admin():
-    with tabs[tab_index]:
-        st.markdown("### 🚨 Critical Incidents")
-        st.markdown("Incidents requiring immediate attention")
-        
-        try:
-            critical = api_client.get_critical_incidents()
-            critical_incidents = critical.get("incidents", [])
-        except:
-            critical_incidents = []
-        
-        if critical_incidents:
-            for incident in critical_incidents:
-                st.error(f"""
-                **🚨 {incident.get('incident_number', 'N/A')}**
-                
-                **{incident.get('title', 'N/A')}**
-                
-                Location: {incident.get('location', 'N/A')}  
-                Status: {incident.get('status', 'N/A').replace('_', ' ').title()}  
-                Reported: {incident.get('created_at', 'N/A')[:16] if incident.get('created_at') else 'N/A'}
-                """)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("Take Action", key=f"critical_action_{incident.get('id', 0)}"):
-                        st.session_state.selected_incident = incident.get('id')
-                        st.info("Opening incident details...")
-                with col2:
-                    if can_update:
-                        if st.button("Escalate", key=f"critical_escalate_{incident.get('id', 0)}"):
-                            try:
-                                api_client.update_incident(
-                                    incident.get('id'),
-                                    {"status": "escalated"},
-                                    user_id
-                                )
-                                st.warning("Incident escalated!")
-                            except:
-                                st.warning("Demo: Incident escalated!")
-                
-                st.markdown("---")
+# Fragment-scoped for the same reason as the list: escalations rerun
+# only this block
+@st.fragment
+def _render_critical_tab():
+    global f_critical
+
+    st.markdown("### 🚨 Critical Incidents")
+    st.markdown("Incidents requiring immediate attention")
+
+    flash = st.session_state.pop("critical_flash", None)
+    if flash:
+        st.warning(flash)
+
+    try:
+        if f_critical is not None:
+            critical = f_critical.result()
+            f_critical = None
         else:
-            st.success("✅ No critical incidents at this time")
+            critical = _fetch_critical()
+        critical_incidents = critical.get("incidents", [])
+    except:
+        critical_incidents = []
+    
+    if critical_incidents:
+        for incident in critical_incidents:
+            # One unpack per row - each field was previously looked up
+            # two or three times across the f-strings and widget keys
+            incident_id = incident.get('id', 0)
+            number = incident.get('incident_number') or 'N/A'
+            inc_title = incident.get('title') or 'N/A'
+            location = incident.get('location') or 'N/A'
+            status = (incident.get('status') or 'N/A').replace('_', ' ').title()
+            created = incident.get('created_at') or ''
+
+            st.error(f"""
+            **🚨 {number}**
+
+            **{inc_title}**
+
+            Location: {location}  
+            Status: {status}  
+            Reported: {created[:16] if created else 'N/A'}
+            """)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Take Action", key=f"critical_action_{incident_id}"):
+                    st.session_state.selected_incident = incident_id
+                    st.info("Opening incident details...")
+            with col2:
+                if can_update:
+                    st.button(
+                        "Escalate",
+                        key=f"critical_escalate_{incident_id}",
+                        on_click=_escalate_incident,
+                        args=(incident_id,),
+                    )
+            
+            st.markdown("---")
+    else:
+        st.success("✅ No critical incidents at this time")
+
+
+if (is_sec or is_adm) and active_tab == "🚨 Critical":
+    _render_critical_tab()
 
 # Sidebar
 with st.sidebar:
-    if is_resident():
+    if is_res:
         st.markdown("### 📞 Emergency Contacts")
         st.markdown("""
         - **Security Office:** Ext. 100
@@ -1,3 +1,4 @@
 from .api_client import api_client, APIClient
+from .images import b64encode_stream, compress_image, to_base64
 
-__all__ = ["api_client", "APIClient"]
+__all__ = ["api_client", "APIClient", "b64encode_stream", "compress_image", "to_base64"]
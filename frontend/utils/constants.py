@@ -0,0 +1,49 @@
+"""Shared widget vocabularies for the Streamlit pages.
+
+The Watchlist and Incidents pages render the same category, severity and
+status lists. Defining them here as tuples means one allocation at
+import instead of a fresh list literal inside every ``st.selectbox``
+call per rerun, and immutable options hash stably for Streamlit's
+widget-identity checks.
+"""
+
+WATCHLIST_CATEGORIES = (
+    "banned", "suspicious", "trespasser", "theft",
+    "harassment", "fraud", "violence",
+)
+
+INCIDENT_CATEGORIES = (
+    "unauthorized_entry", "theft", "vandalism", "harassment",
+    "suspicious_activity", "parking_violation", "noise_complaint",
+    "fire_safety", "medical_emergency", "visitor_issue",
+    "equipment_failure", "other",
+)
+
+# The reduced vocabulary residents see in the report form
+RESIDENT_INCIDENT_CATEGORIES = (
+    "suspicious_activity", "noise_complaint", "parking_violation",
+    "visitor_issue", "equipment_failure", "other",
+)
+
+SEVERITIES = ("critical", "high", "medium", "low")
+
+INCIDENT_STATUSES = (
+    "open", "in_progress", "pending_review",
+    "resolved", "closed", "escalated",
+)
+
+# Stable format_func callables - a fresh lambda per rerun defeats
+# Streamlit's widget-kwargs hashing
+TITLE = str.title
+
+
+def PRETTY(value: str) -> str:
+    return value.replace("_", " ").title()
+
+
+# Precomputed value -> display-label maps. format_func=<dict>.get is one
+# dict lookup per option per rerun instead of a .replace().title() pass;
+# "All" is included so the filter selectboxes can share them.
+CATEGORY_LABELS = {c: PRETTY(c) for c in ("All",) + INCIDENT_CATEGORIES}
+STATUS_LABELS = {s: PRETTY(s) for s in ("All",) + INCIDENT_STATUSES}
+SEVERITY_LABELS = {s: s.title() for s in ("All",) + SEVERITIES}
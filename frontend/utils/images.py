@@ -0,0 +1,116 @@
+"""Image helpers for the Streamlit frontend.
+
+Camera and phone uploads are routinely 2-5MB; the face recognition
+pipeline only needs a few hundred pixels on the long edge. Downscaling
+before base64-encoding shrinks the request payload (and the backend's
+decode work) by an order of magnitude.
+"""
+
+import binascii
+from io import BytesIO
+
+from PIL import Image
+
+# Face recognition works fine at this size; anything larger just costs
+# bandwidth and encode/decode time
+MAX_DIMENSIONS = (640, 640)
+JPEG_QUALITY = 85
+
+
+def compress_image(image_bytes: bytes) -> bytes:
+    """Downscale and re-encode an image as JPEG for upload.
+
+    Returns the original bytes unchanged if Pillow can't parse them,
+    so callers never have to special-case odd uploads.
+    """
+    try:
+        img = Image.open(BytesIO(image_bytes))
+    except Exception:
+        return image_bytes
+
+    img.thumbnail(MAX_DIMENSIONS)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    compressed = buffer.getvalue()
+
+    # A tiny original can come out larger after re-encoding
+    return compressed if len(compressed) < len(image_bytes) else image_bytes
+
+
+# Inline previews need far fewer pixels than the stored evidence
+THUMBNAIL_DIMENSIONS = (512, 512)
+
+
+def make_thumbnail(image_bytes: bytes, dimensions=THUMBNAIL_DIMENSIONS):
+    """Decode and downscale image bytes for an inline preview.
+
+    Returns a PIL image, or None if Pillow can't parse the bytes, so
+    callers can skip the preview instead of breaking the form.
+    """
+    try:
+        img = Image.open(BytesIO(image_bytes))
+    except Exception:
+        return None
+
+    img.thumbnail(dimensions)
+    return img
+
+
+_BASE64_ALPHABET = frozenset(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=\r\n"
+)
+
+
+def to_base64(image_bytes: bytes) -> str:
+    """Compress and base64-encode image bytes for a JSON payload.
+
+    Fast path: payloads re-submitted from session state are sometimes
+    already base64 text; detect that (sniff the first 64 bytes against
+    the base64 alphabet, then validate) and return it unchanged instead
+    of double-encoding.
+    """
+    head = image_bytes[:64]
+    if head and all(c in _BASE64_ALPHABET for c in head):
+        try:
+            binascii.a2b_base64(image_bytes)
+            return image_bytes.decode("ascii")
+        except (binascii.Error, ValueError, UnicodeDecodeError):
+            pass
+
+    return binascii.b2a_base64(compress_image(image_bytes), newline=False).decode("ascii")
+
+
+# Multiple of 3 so each chunk encodes without mid-stream padding
+_B64_CHUNK = 57 * 1024
+
+# Below this size one C-level binascii call beats the chunk loop and
+# the peak-memory argument for chunking doesn't apply
+_B64_SINGLE_CALL_MAX = 1024 * 1024
+
+
+def b64encode_stream(fileobj, chunk_size: int = _B64_CHUNK) -> str:
+    """Base64-encode a file object.
+
+    Small files (the common case for camera/phone photos after
+    compression) go through a single binascii.b2a_base64 call - one
+    C-level pass, no Python-loop dispatch per chunk. Larger files fall
+    back to chunked encoding: base64 of f.read() holds the raw bytes,
+    the encoded bytes and the decoded str at once - roughly 3x the file
+    size in peak RAM - while chunking keeps the working set near one
+    chunk.
+    """
+    size = fileobj.seek(0, 2)
+    fileobj.seek(0)
+    if size <= _B64_SINGLE_CALL_MAX:
+        return binascii.b2a_base64(fileobj.read(), newline=False).decode("ascii")
+
+    out = BytesIO()
+    while True:
+        buf = fileobj.read(chunk_size)
+        if not buf:
+            break
+        out.write(binascii.b2a_base64(buf, newline=False))
+    return out.getvalue().decode("ascii")
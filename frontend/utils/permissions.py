@@ -4,6 +4,7 @@ Permission utilities for role-based access control in Streamlit UI
 
 import streamlit as st
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
 
 class Permission(str, Enum):
@@ -44,118 +45,145 @@ class Permission(str, Enum):
     USER_DELETE = "user:delete"
 
 
-# Role-based permission mapping
+# Plain-string permission values, resolved from the enum once so the
+# role tables below don't repeat ~150 descriptor lookups at import
+_P = {name: member.value for name, member in Permission.__members__.items()}
+
+# Role-based permission mapping - frozensets, so each membership check
+# is one hash lookup instead of a scan over ~25 strings
 ROLE_PERMISSIONS = {
-    "super_admin": [p.value for p in Permission],  # All permissions
+    "super_admin": frozenset(_P.values()),  # All permissions
     
-    "admin": [
-        Permission.DASHBOARD_VIEW.value,
-        Permission.DASHBOARD_ANALYTICS.value,
-        Permission.VISITOR_CREATE.value,
-        Permission.VISITOR_READ.value,
-        Permission.VISITOR_UPDATE.value,
-        Permission.VISITOR_DELETE.value,
-        Permission.VISITOR_APPROVE.value,
-        Permission.GATE_VERIFY.value,
-        Permission.GATE_MANUAL_OVERRIDE.value,
-        Permission.GATE_LOGS_VIEW.value,
-        Permission.WATCHLIST_READ.value,
-        Permission.WATCHLIST_CREATE.value,
-        Permission.WATCHLIST_UPDATE.value,
-        Permission.WATCHLIST_DELETE.value,
-        Permission.WATCHLIST_ALERTS.value,
-        Permission.INCIDENT_CREATE.value,
-        Permission.INCIDENT_READ.value,
-        Permission.INCIDENT_UPDATE.value,
-        Permission.INCIDENT_ASSIGN.value,
-        Permission.USER_READ.value,
-        Permission.USER_UPDATE.value,
-    ],
+    "admin": frozenset({
+        _P["DASHBOARD_VIEW"],
+        _P["DASHBOARD_ANALYTICS"],
+        _P["VISITOR_CREATE"],
+        _P["VISITOR_READ"],
+        _P["VISITOR_UPDATE"],
+        _P["VISITOR_DELETE"],
+        _P["VISITOR_APPROVE"],
+        _P["GATE_VERIFY"],
+        _P["GATE_MANUAL_OVERRIDE"],
+        _P["GATE_LOGS_VIEW"],
+        _P["WATCHLIST_READ"],
+        _P["WATCHLIST_CREATE"],
+        _P["WATCHLIST_UPDATE"],
+        _P["WATCHLIST_DELETE"],
+        _P["WATCHLIST_ALERTS"],
+        _P["INCIDENT_CREATE"],
+        _P["INCIDENT_READ"],
+        _P["INCIDENT_UPDATE"],
+        _P["INCIDENT_ASSIGN"],
+        _P["USER_READ"],
+        _P["USER_UPDATE"],
+    }),
     
-    "security_manager": [
-        Permission.DASHBOARD_VIEW.value,
-        Permission.DASHBOARD_ANALYTICS.value,
-        Permission.VISITOR_READ.value,
-        Permission.VISITOR_APPROVE.value,
-        Permission.GATE_VERIFY.value,
-        Permission.GATE_MANUAL_OVERRIDE.value,
-        Permission.GATE_LOGS_VIEW.value,
-        Permission.WATCHLIST_READ.value,
-        Permission.WATCHLIST_CREATE.value,
-        Permission.WATCHLIST_UPDATE.value,
-        Permission.WATCHLIST_ALERTS.value,
-        Permission.INCIDENT_CREATE.value,
-        Permission.INCIDENT_READ.value,
-        Permission.INCIDENT_UPDATE.value,
-        Permission.INCIDENT_ASSIGN.value,
-    ],
+    "security_manager": frozenset({
+        _P["DASHBOARD_VIEW"],
+        _P["DASHBOARD_ANALYTICS"],
+        _P["VISITOR_READ"],
+        _P["VISITOR_APPROVE"],
+        _P["GATE_VERIFY"],
+        _P["GATE_MANUAL_OVERRIDE"],
+        _P["GATE_LOGS_VIEW"],
+        _P["WATCHLIST_READ"],
+        _P["WATCHLIST_CREATE"],
+        _P["WATCHLIST_UPDATE"],
+        _P["WATCHLIST_ALERTS"],
+        _P["INCIDENT_CREATE"],
+        _P["INCIDENT_READ"],
+        _P["INCIDENT_UPDATE"],
+        _P["INCIDENT_ASSIGN"],
+    }),
     
-    "security_guard": [
-        Permission.DASHBOARD_VIEW.value,
-        Permission.VISITOR_READ.value,
-        Permission.GATE_VERIFY.value,
-        Permission.GATE_LOGS_VIEW.value,
-        Permission.WATCHLIST_READ.value,
-        Permission.WATCHLIST_ALERTS.value,
-        Permission.INCIDENT_CREATE.value,
-        Permission.INCIDENT_READ.value,
-    ],
+    "security_guard": frozenset({
+        _P["DASHBOARD_VIEW"],
+        _P["VISITOR_READ"],
+        _P["GATE_VERIFY"],
+        _P["GATE_LOGS_VIEW"],
+        _P["WATCHLIST_READ"],
+        _P["WATCHLIST_ALERTS"],
+        _P["INCIDENT_CREATE"],
+        _P["INCIDENT_READ"],
+    }),
     
-    "resident": [
-        Permission.DASHBOARD_VIEW.value,
-        Permission.VISITOR_CREATE.value,  # Can pre-approve their own visitors
-        Permission.VISITOR_READ.value,    # Can view their own visitors only
-        Permission.INCIDENT_CREATE.value, # Can report incidents
-        Permission.INCIDENT_READ.value,   # Can view their own incidents
-    ],
+    "resident": frozenset({
+        _P["DASHBOARD_VIEW"],
+        _P["VISITOR_CREATE"],  # Can pre-approve their own visitors
+        _P["VISITOR_READ"],    # Can view their own visitors only
+        _P["INCIDENT_CREATE"], # Can report incidents
+        _P["INCIDENT_READ"],   # Can view their own incidents
+    }),
     
-    "receptionist": [
-        Permission.DASHBOARD_VIEW.value,
-        Permission.VISITOR_CREATE.value,
-        Permission.VISITOR_READ.value,
-        Permission.VISITOR_UPDATE.value,
-        Permission.VISITOR_APPROVE.value,
-        Permission.GATE_VERIFY.value,
-        Permission.GATE_LOGS_VIEW.value,
-        Permission.INCIDENT_CREATE.value,
-        Permission.INCIDENT_READ.value,
-    ],
+    "receptionist": frozenset({
+        _P["DASHBOARD_VIEW"],
+        _P["VISITOR_CREATE"],
+        _P["VISITOR_READ"],
+        _P["VISITOR_UPDATE"],
+        _P["VISITOR_APPROVE"],
+        _P["GATE_VERIFY"],
+        _P["GATE_LOGS_VIEW"],
+        _P["INCIDENT_CREATE"],
+        _P["INCIDENT_READ"],
+    }),
 }
 
 
+_ADMIN_ROLES = frozenset({"admin", "super_admin"})
+_SECURITY_ROLES = frozenset({"security_guard", "security_manager"})
+
+
 def get_user_role() -> str:
     """Get current user's role from session state"""
     return st.session_state.get("user_role", "unknown")
 
 
-def get_user_permissions() -> List[str]:
+def get_user_permissions() -> frozenset:
     """Get current user's permissions from session state or derive from role"""
     # First check if permissions are stored in session
     stored_permissions = st.session_state.get("permissions", [])
     if stored_permissions:
-        return stored_permissions
-    
+        return frozenset(stored_permissions)
+
     # Otherwise derive from role
     role = get_user_role()
-    return ROLE_PERMISSIONS.get(role, [])
+    return ROLE_PERMISSIONS.get(role, frozenset())
+
+
+def _permission_set() -> frozenset:
+    """Current user's permissions as a frozenset, memoized per session.
+
+    Pages call has_permission several times at the top of every rerun;
+    memoizing here turns each check into a set lookup. The memo is keyed
+    on (role, permission count) so it refreshes when the session logs in
+    as someone else.
+    """
+    role = get_user_role()
+    stored = st.session_state.get("permissions", [])
+    key = (role, len(stored))
+
+    cached = st.session_state.get("_perm_set")
+    if cached and cached[0] == key:
+        return cached[1]
+
+    perms = frozenset(stored) if stored else ROLE_PERMISSIONS.get(role, frozenset())
+    st.session_state["_perm_set"] = (key, perms)
+    return perms
 
 
 def has_permission(permission: str) -> bool:
     """Check if current user has a specific permission"""
-    permissions = get_user_permissions()
-    return permission in permissions
+    return permission in _permission_set()
 
 
 def has_any_permission(*permissions: str) -> bool:
     """Check if current user has any of the specified permissions"""
-    user_permissions = get_user_permissions()
-    return any(p in user_permissions for p in permissions)
+    return not _permission_set().isdisjoint(permissions)
 
 
 def has_all_permissions(*permissions: str) -> bool:
     """Check if current user has all of the specified permissions"""
-    user_permissions = get_user_permissions()
-    return all(p in user_permissions for p in permissions)
+    return _permission_set().issuperset(permissions)
 
 
 def require_permission(permission: str, show_error: bool = True) -> bool:
@@ -196,66 +224,98 @@ def is_receptionist() -> bool:
 
 def is_security_staff() -> bool:
     """Check if current user is security staff (guard or manager)"""
-    return get_user_role() in ["security_guard", "security_manager"]
+    return get_user_role() in _SECURITY_ROLES
 
 
 def is_admin() -> bool:
     """Check if current user is an admin"""
-    return get_user_role() in ["admin", "super_admin"]
+    return get_user_role() in _ADMIN_ROLES
+
+
+ALL_PAGES = (
+    {
+        "name": "Dashboard",
+        "icon": "🏠",
+        "file": "pages/1_🏠_Dashboard.py",
+        "permission": _P["DASHBOARD_VIEW"],
+    },
+    {
+        "name": "Visitor Approval",
+        "icon": "👤",
+        "file": "pages/2_👤_Visitor_Approval.py",
+        "permission": _P["VISITOR_CREATE"],
+    },
+    {
+        "name": "Gate Verification",
+        "icon": "🚪",
+        "file": "pages/3_🚪_Gate_Verification.py",
+        "permission": _P["GATE_VERIFY"],
+    },
+    {
+        "name": "Watchlist",
+        "icon": "⚠️",
+        "file": "pages/4_⚠️_Watchlist.py",
+        "permission": _P["WATCHLIST_READ"],
+    },
+    {
+        "name": "Incidents",
+        "icon": "📋",
+        "file": "pages/5_📋_Incidents.py",
+        "permission": _P["INCIDENT_READ"],
+    },
+)
+
+
+@lru_cache(maxsize=8)
+def _pages_for(permissions: frozenset) -> tuple:
+    """Filter ALL_PAGES once per distinct permission set.
+
+    There are only a handful of roles, so the cache stays tiny while the
+    sidebar stops rebuilding the page list on every rerun.
+    """
+    return tuple(page for page in ALL_PAGES if page["permission"] in permissions)
+
+
+def get_accessible_pages() -> tuple:
+    """Get pages accessible to current user"""
+    return _pages_for(_permission_set())
+
+
+def build_page_acl(role: str) -> dict:
+    """Page file -> allowed mapping for a role, from the static tables"""
+    permissions = ROLE_PERMISSIONS.get(role, frozenset())
+    return {page["file"]: page["permission"] in permissions for page in ALL_PAGES}
 
 
-def get_accessible_pages() -> List[dict]:
-    """Get list of pages accessible to current user"""
+def page_allowed(page_file: str) -> bool:
+    """One-lookup page guard against an ACL cached per session role"""
     role = get_user_role()
-    permissions = get_user_permissions()
-    
-    all_pages = [
-        {
-            "name": "Dashboard",
-            "icon": "🏠",
-            "file": "pages/1_🏠_Dashboard.py",
-            "permission": Permission.DASHBOARD_VIEW.value,
-        },
-        {
-            "name": "Visitor Approval",
-            "icon": "👤",
-            "file": "pages/2_👤_Visitor_Approval.py",
-            "permission": Permission.VISITOR_CREATE.value,
-        },
-        {
-            "name": "Gate Verification",
-            "icon": "🚪",
-            "file": "pages/3_🚪_Gate_Verification.py",
-            "permission": Permission.GATE_VERIFY.value,
-        },
-        {
-            "name": "Watchlist",
-            "icon": "⚠️",
-            "file": "pages/4_⚠️_Watchlist.py",
-            "permission": Permission.WATCHLIST_READ.value,
-        },
-        {
-            "name": "Incidents",
-            "icon": "📋",
-            "file": "pages/5_📋_Incidents.py",
-            "permission": Permission.INCIDENT_READ.value,
-        },
-    ]
-    
-    return [page for page in all_pages if page["permission"] in permissions]
+    cached = st.session_state.get("_page_acl")
+    if not cached or cached[0] != role:
+        cached = (role, build_page_acl(role))
+        st.session_state["_page_acl"] = cached
+    return cached[1].get(page_file, False)
+
+
+_ROLE_NAMES = {
+    "super_admin": "🔴 Super Admin",
+    "admin": "🟠 Admin",
+    "security_manager": "🔵 Security Manager",
+    "security_guard": "🟢 Security Guard",
+    "resident": "🟣 Resident",
+    "receptionist": "🟢 Receptionist"
+}
+
+
+@lru_cache(maxsize=16)
+def _display_name_for(role: str) -> str:
+    """Resolve a role's display label once; headers and menus repeat it"""
+    return _ROLE_NAMES.get(role, role.title())
 
 
 def get_role_display_name(role: str) -> str:
     """Get display name for role"""
-    role_names = {
-        "super_admin": "🔴 Super Admin",
-        "admin": "🟠 Admin",
-        "security_manager": "🔵 Security Manager",
-        "security_guard": "🟢 Security Guard",
-        "resident": "🟣 Resident",
-        "receptionist": "🟢 Receptionist"
-    }
-    return role_names.get(role, role.title())
+    return _display_name_for(role)
 
 
 def show_permission_denied():